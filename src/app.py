@@ -59,6 +59,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for the application."""
     container = app.container  # type: ignore
 
+    # Create the collection and migrate its date index before the first request needs them
+    await asyncio.to_thread(container.vector_store().ensure_collection)
+
     # Initialize Telegram bot
     bot_application = None
     bot_task = None
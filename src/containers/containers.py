@@ -81,6 +81,7 @@ class AppContainer(containers.DeclarativeContainer):
         PapersProcessor,
         vector_store=vector_store,
         embedding_service=embedding_service,
+        arxiv_cache_dir=config.arxiv_cache_dir,
     )
 
     # Arxiv entities
@@ -59,5 +59,5 @@ class Classifier:
         response = self.llm_client.ask(prompt).text
         self.inference_price = self.llm_client.inference_price
         self.total_price += self.inference_price
-        logger.info(f"Classifier inference price: {self.llm_client.inference_price}")
+        logger.opt(lazy=True).info("Classifier inference price: {}", lambda: self.llm_client.inference_price)
         return response is not None and response.lower() == "yes"
@@ -1,13 +1,17 @@
 """Gemini Api Client."""
 
+import functools
 import json
+import math
 import os
+from pathlib import Path
 from typing import Literal
 
 from dotenv import load_dotenv
 from google import genai
 from google.cloud import aiplatform
 from google.genai.types import (
+    Blob,
     Content,
     FileData,
     GenerateContentConfig,
@@ -25,11 +29,38 @@ from src.utils.price_caculation import calculate_inference_price
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=8)
+def get_genai_client(project: str, location: str, timeout_ms: int) -> genai.Client:
+    """Initialize aiplatform and create a Gemini client once per process and configuration.
+
+    Args:
+        project (str): The Google Cloud project id.
+        location (str): The Vertex AI location.
+        timeout_ms (int): The request timeout in milliseconds.
+
+    Returns:
+        genai.Client: The shared Gemini client.
+    """
+    aiplatform.init(project=project, location=location)
+    logger.info("aiplatform has been initialized.")
+    client = genai.Client(
+        vertexai=True,
+        project=project,
+        location=location,
+        http_options=HttpOptions(timeout=timeout_ms),
+    )
+    logger.info("gemini client has been initialized.")
+    return client
+
+
 class GeminiApiClient:
     """Gemini Api Client class."""
 
     prediction_timeout: int = 120
     location: str = "global"
+    # Inline data is sent base64-encoded, which grows it by 4/3, and a request carrying it must stay under
+    # about 20 MB, so the encoded PDF is capped below that to leave room for the prompt
+    inline_pdf_max_encoded_bytes: int = 18 * 1024 * 1024
 
     def __init__(
         self,
@@ -49,20 +80,10 @@ class GeminiApiClient:
             thinking_level: The thinking level to use.
             verbose: Whether to log the prompt to Gemini.
         """
-        # Initialize aiplatform
+        # Get the shared gemini client
         self._load_project_id_from_creds()
         self.model_name = model_name
-        aiplatform.init(project=self.project, location=self.location)
-        logger.info("aiplatform has been initialized.")
-
-        # Initialize the gemini client
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.project,
-            location=self.location,
-            http_options=HttpOptions(timeout=self.prediction_timeout * 1000),
-        )
-        logger.info("gemini client has been initialized.")
+        self.client = get_genai_client(self.project, self.location, self.prediction_timeout * 1000)
 
         # Initialize the bucket
         self.bucket = GoogleBucket(bucket_prefix="pdfs")
@@ -73,6 +94,7 @@ class GeminiApiClient:
         self.thinking_level = ThinkingLevel(thinking_level.upper())
         self._system_prompt = system_prompt
         self.file_uris: list[str] = []
+        self.inline_pdfs: list[bytes] = []
         self.total_inference_price: float = 0.0
         self.total_requests: int = 0
         self.inference_price: float = 0.0
@@ -120,6 +142,26 @@ class GeminiApiClient:
             raise ValueError(msg)  # noqa: TRY004
         self._system_prompt = prompt
 
+    @staticmethod
+    def _get_token_counts(response: GenerateContentResponse) -> tuple[int, int, int, int]:
+        """Read the token counts from the response usage metadata in one pass.
+
+        Args:
+            response (GenerateContentResponse): The response from Gemini.
+
+        Returns:
+            tuple[int, int, int, int]: Prompt, candidates, thoughts and cached content token counts.
+        """
+        usage = response.usage_metadata
+        if usage is None:
+            return 0, 0, 0, 0
+        return (
+            usage.prompt_token_count or 0,
+            usage.candidates_token_count or 0,
+            usage.thoughts_token_count or 0,
+            usage.cached_content_token_count or 0,
+        )
+
     def calculate_stats(self, response: GenerateContentResponse, effective_model: str | None = None) -> None:
         """Calculate the stats for the response.
 
@@ -128,10 +170,9 @@ class GeminiApiClient:
             effective_model (str | None): The model used for this request (for accurate pricing).
         """
         # Calculate the stats
-        prompt_token_count = getattr(response.usage_metadata, "prompt_token_count", 0) or 0
-        candidates_token_count = getattr(response.usage_metadata, "candidates_token_count", 0) or 0
-        thoughts_token_count = getattr(response.usage_metadata, "thoughts_token_count", 0) or 0
-        cached_content_token_count = getattr(response.usage_metadata, "cached_content_token_count", 0) or 0
+        prompt_token_count, candidates_token_count, thoughts_token_count, cached_content_token_count = (
+            self._get_token_counts(response)
+        )
 
         model_for_pricing = effective_model if effective_model is not None else self.model_name
         self.inference_price = calculate_inference_price(
@@ -145,16 +186,26 @@ class GeminiApiClient:
         self.total_inference_price += self.inference_price
 
     def attach_pdf(self, gcs_uri: str) -> None:
-        """Attach a PDF (or text file) for native processing.
+        """Attach a PDF (or text file) for native processing, ignoring already attached URIs.
 
         Args:
             gcs_uri (str): The URI of the PDF file to attach.
         """
-        self.file_uris.append(gcs_uri)
+        if gcs_uri not in self.file_uris:
+            self.file_uris.append(gcs_uri)
+
+    def attach_pdf_bytes(self, data: bytes) -> None:
+        """Attach raw PDF bytes to be sent inline with the request.
+
+        Args:
+            data (bytes): The content of the PDF file.
+        """
+        self.inline_pdfs.append(data)
 
     def clear_pdfs(self) -> None:
-        """Clear all attached document URIs."""
+        """Clear all attached document URIs and inline PDFs."""
         self.file_uris = []
+        self.inline_pdfs = []
 
     def ask(
         self,
@@ -185,6 +236,13 @@ class GeminiApiClient:
                     parts=[Part(file_data=FileData(file_uri=uri, mime_type="application/pdf"))],
                 ),
             )
+        for data in self.inline_pdfs:
+            contents.append(  # noqa: PERF401
+                Content(
+                    role="user",
+                    parts=[Part(inline_data=Blob(data=data, mime_type="application/pdf"))],
+                ),
+            )
 
         # User message
         contents.append(Content(role="user", parts=[Part(text=user_prompt)]))
@@ -229,17 +287,26 @@ class GeminiApiClient:
         Returns:
             str | None: The generated text response.
         """
-        # Attach the PDF file if provided
+        # Attach the PDF file if provided: small files go inline, large ones through the bucket
+        pdf_uri: str | None = None
         if pdf_local_path is not None:
-            pdf_uri = self.bucket.upload_file(pdf_local_path)
-            self.attach_pdf(pdf_uri)
+            pdf_path = Path(pdf_local_path)
+            # Size of the PDF once base64-encoded: 4 bytes for every started 3 bytes group
+            encoded_size = 4 * math.ceil(pdf_path.stat().st_size / 3)
+            if encoded_size < self.inline_pdf_max_encoded_bytes:
+                self.attach_pdf_bytes(pdf_path.read_bytes())
+            else:
+                pdf_uri = self.bucket.upload_file(pdf_local_path)
+                self.attach_pdf(pdf_uri)
 
         # Send the prompt to Gemini
-        response = self.ask(user_prompt, model_name=model_name, thinking_level=thinking_level)
-
-        # Remove the PDF file from the bucket
-        if pdf_local_path is not None:
-            self.clear_pdfs()
-            self.bucket.remove_file(pdf_uri)
+        try:
+            response = self.ask(user_prompt, model_name=model_name, thinking_level=thinking_level)
+        finally:
+            # Detach the PDF file and remove it from the bucket, blob names are shared between clients
+            if pdf_local_path is not None:
+                self.clear_pdfs()
+                if pdf_uri is not None:
+                    self.bucket.remove_file(pdf_uri)
 
         return response.text
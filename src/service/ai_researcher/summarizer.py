@@ -8,6 +8,10 @@ from loguru import logger
 from src.service.ai_researcher.gemini_client import GeminiApiClient
 from src.utils.schemas import Paper
 
+FILENAME_TRANSLATION_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_", ":": "_", "?": "", '"': ""})
+# Filesystems limit names to 255 bytes, so the stem is cut on its UTF-8 length to leave room for the suffix
+MAX_FILENAME_STEM_BYTES = 200
+
 
 class Summarizer:
     """Summarizer for research papers."""
@@ -54,12 +58,15 @@ class Summarizer:
         )
         self.inference_price = self.llm_client.inference_price
         self.total_price += self.inference_price
-        logger.info(f"Summarizer inference price: {self.llm_client.inference_price}")
+        logger.opt(lazy=True).info("Summarizer inference price: {}", lambda: self.llm_client.inference_price)
 
         if response_text is None:
             return None, None, None, None
 
-        file_name = f"{paper.title.replace(' ', '_').lower()}_summary.md"
+        stem = paper.title.translate(FILENAME_TRANSLATION_TABLE).lower()
+        # A multibyte character cut in half is dropped rather than left invalid
+        stem = stem.encode()[:MAX_FILENAME_STEM_BYTES].decode(errors="ignore")
+        file_name = f"{stem}_summary.md"
         md_path = Path(self.tmp_storage_dir) / file_name
         md_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -1,44 +1,114 @@
 """arXiv paper fetcher."""
 
-import re
+import asyncio
+import hashlib
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import UTC, datetime, timedelta
-from urllib import error, parse, request
-from xml.etree import ElementTree as ET
+from operator import attrgetter
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+from urllib import parse
 
+import httpx
 from dateutil import parser
 from loguru import logger
+from lxml import etree
+from pydantic import TypeAdapter
 from tqdm import tqdm
 
 from src.service.arxiv.arxiv_utils import (
-    ARXIV_ID_REGEX,
-    count_inclusive_days,
-    deduplicate_papers_by_base_id,
-    get_base_paper_id,
-    iter_daily_ranges,
-    safe_get_text,
-    should_skip_collection_window,
+    VERSION_SUFFIX_REGEX,
+    WHITESPACE_REGEX,
+    extract_arxiv_id,
+    iter_daily_ranges_excluding,
+    iter_merged_ranges,
 )
+from src.utils.rate_limiter import RequestRateLimiter
 from src.utils.schemas import Paper
 
+PAPER_LIST_ADAPTER = TypeAdapter(list[Paper])
+
 
 class ArxivFetcher:
     """Class to fetch and filter arXiv papers based on keywords, categories, and date range."""
 
     predefined_categories: tuple[str, str, str] = ("cs.CV", "cs.LG", "cs.AI")
-    base_url: str = "http://export.arxiv.org/api/query?"
+    base_url: str = "https://export.arxiv.org/api/query?"
     atom_namespace = "{http://www.w3.org/2005/Atom}"
+    arxiv_namespace = "{http://arxiv.org/schemas/atom}"
+    entry_tag: str = f"{atom_namespace}entry"
+    id_tag: str = f"{atom_namespace}id"
+    title_tag: str = f"{atom_namespace}title"
+    summary_tag: str = f"{atom_namespace}summary"
+    published_tag: str = f"{atom_namespace}published"
+    updated_tag: str = f"{atom_namespace}updated"
+    author_tag: str = f"{atom_namespace}author"
+    name_tag: str = f"{atom_namespace}name"
+    primary_category_tag: str = f"{arxiv_namespace}primary_category"
     max_display_authors: int = 10
-
-    def __init__(self, page_size: int = 50) -> None:
+    request_timeout: float = 60.0
+    max_concurrent_requests: int = 4
+    # arXiv asks API clients to start at most one request every three seconds
+    min_request_interval: float = 3.0
+    max_window_days: int = 3
+    # Progress bars redraw at most this often and are disabled when stderr is not a terminal
+    progress_min_interval: float = 5.0
+    # Papers keep being announced for a few days after submission, so recent windows are cached only briefly
+    cache_settle_period: timedelta = timedelta(days=7)
+    recent_cache_ttl_seconds: float = 24 * 60 * 60
+
+    def __init__(
+        self,
+        page_size: int = 50,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         """Initialize the ArxivFetcher with search parameters.
 
         Args:
             page_size (int): Number of results per page for the arXiv client.
+            cache_dir (str | Path | None): Directory caching the papers of every fetched period on disk.
+                Caching is disabled when empty or None.
         """
         self.page_size = page_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.seen_paper_ids: set[str] = set()
+        # Shared by all requests of this fetcher, including concurrently fetched periods
+        self._rate_limiter = RequestRateLimiter(self.min_request_interval)
+        # Keep-alive client reused across all page requests
+        self._client = httpx.Client(
+            timeout=self.request_timeout,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+            follow_redirects=True,
+        )
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context.
+
+        Returns:
+            Self: The fetcher itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the HTTP client when leaving the runtime context.
+
+        Args:
+            exc_type (type[BaseException] | None): The exception type, if any.
+            exc_value (BaseException | None): The exception instance, if any.
+            traceback (TracebackType | None): The traceback, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self._client.close()
 
     def _build_arxiv_query(
         self,
@@ -97,113 +167,225 @@ class ArxivFetcher:
             raise ValueError(msg)
         return start_date_obj, end_date_obj
 
-    def _get_main_authors(self, authors: list[str]) -> list[str]:
-        """Get the main authors from the list of authors.
+    def _build_page_url_prefix(self, search_query: str) -> str:
+        """Build the URL of a search query up to the start index of the result page.
+
+        The query is percent-encoded once, so page URLs only need the start index appended.
 
         Args:
-            authors (list[str]): The list of authors names.
+            search_query (str): The arXiv search query.
 
         Returns:
-            list[str]: The list of authors names.
+            str: The page URL without the start index value.
         """
-        if len(authors) > self.max_display_authors:
-            return [*authors[: self.max_display_authors - 1], authors[-1]]
-        return authors
+        return (
+            f"{self.base_url}search_query={parse.quote_plus(search_query)}"
+            f"&max_results={self.page_size}&sortBy=submittedDate&sortOrder=ascending&start="
+        )
 
-    def _extract_entities(self, url: str) -> list[ET.Element]:
-        """Extract entities from the XML response.
+    def _extract_papers(self, url: str) -> list[Paper] | None:
+        """Extract papers from the XML response.
 
         Args:
-            url (str): The URL to extract entities from.
+            url (str): The URL to extract papers from.
 
         Returns:
-            list[ET.Element]: The list of entities.
+            list[Paper] | None: The list of papers, None if the request failed.
         """
         try:
-            # Make the API request
-            with request.urlopen(url) as response:  # noqa: S310
-                response_data = response.read().decode("utf-8")
-        except error.HTTPError as exp:
-            logger.error(f"HTTP Error: {exp.code} {exp.reason} for URL: {url}")
-            return []
-
-        # Parse the XML response (Atom feed)
-        root = ET.fromstring(response_data)  # noqa: S314
-        return root.findall(f"{self.atom_namespace}entry")
-
-    def parse_papers_info(self, entities: list[ET.Element]) -> list[Paper]:
+            # Make the API request over the pooled connection
+            self._rate_limiter.wait()
+            with self._client.stream("GET", url) as response:
+                response.raise_for_status()
+                # Parse the XML response (Atom feed) while the rest of it is still downloading
+                return self.parse_papers_info(response.iter_bytes())
+        except httpx.HTTPStatusError as exp:
+            logger.error(f"HTTP Error: {exp.response.status_code} {exp.response.reason_phrase} for URL: {url}")
+            return None
+
+    async def _aextract_papers(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+    ) -> list[Paper] | None:
+        """Extract papers from the XML response without blocking the event loop.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client to send the request with.
+            url (str): The URL to extract papers from.
+
+        Returns:
+            list[Paper] | None: The list of papers, None if the request failed.
+        """
+        try:
+            await self._rate_limiter.await_turn()
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exp:
+            logger.error(f"HTTP Error: {exp.response.status_code} {exp.response.reason_phrase} for URL: {url}")
+            return None
+
+        # Parse the XML response (Atom feed) off the event loop
+        return await asyncio.to_thread(self.parse_papers_info, response.content)
+
+    @classmethod
+    def _parse_entry(cls, entry: etree._Element) -> Paper:
+        """Parse the paper information from a single feed entry.
+
+        Args:
+            entry (etree._Element): The feed entry.
+
+        Returns:
+            Paper: The parsed paper.
+        """
+        # Walk the entry children once, dispatching on the tag
+        texts: dict[str, str] = {}
+        # Only the leading authors and the last one are displayed, so the names in between are never read
+        authors: list[str] = []
+        last_author: etree._Element | None = None
+        num_authors = 0
+        primary_category_str = ""
+        # Bind the loop invariants to locals and read author names with lxml's findtext, both resolved in C
+        author_tag, name_tag, primary_category_tag = cls.author_tag, cls.name_tag, cls.primary_category_tag
+        max_leading_authors = cls.max_display_authors - 1
+        for child in entry:
+            tag = child.tag
+            if tag == author_tag:
+                if num_authors < max_leading_authors:
+                    authors.append(child.findtext(name_tag, ""))
+                last_author = child
+                num_authors += 1
+            elif tag == primary_category_tag:
+                primary_category_str = child.get("term", "")
+            else:
+                texts[tag] = child.text or ""
+
+        # Strip the version once here, so the paper id doubles as the base id when deduplicating
+        paper_id = VERSION_SUFFIX_REGEX.sub("", texts.get(cls.id_tag, "").rpartition("/abs/")[2])
+        # arXiv serves the latest version of every paper at this address, so the entry links are not scanned
+        pdf_link = f"https://arxiv.org/pdf/{paper_id}.pdf"
+        # Collapse line breaks and indentation of wrapped text into single spaces
+        title = WHITESPACE_REGEX.sub(" ", texts.get(cls.title_tag, "")).strip()
+        summary = WHITESPACE_REGEX.sub(" ", texts.get(cls.summary_tag, "")).strip()
+        published = texts.get(cls.published_tag, "")
+        published_date_ts = int(datetime.fromisoformat(published).timestamp())
+        updated = texts.get(cls.updated_tag, "")
+        updated_date_ts = datetime.fromisoformat(updated).timestamp()
+        if last_author is not None and num_authors > len(authors):
+            authors.append(last_author.findtext(name_tag, ""))
+
+        # Every field is already built with its declared type, so pydantic validation is skipped
+        return Paper.model_construct(
+            paper_id=paper_id,
+            title=title,
+            authors=authors,
+            summary=summary,
+            published_date=published,
+            published_date_ts=published_date_ts,
+            updated_date=updated,
+            updated_date_ts=updated_date_ts,
+            pdf_url=pdf_link,
+            primary_category=primary_category_str,
+        )
+
+    @classmethod
+    def _iter_parsed_papers(cls, parser: etree.XMLPullParser) -> Iterator[Paper]:
+        """Yield the papers of the entries the pull parser has completed so far.
+
+        Args:
+            parser (etree.XMLPullParser): Parser fed with (part of) an Atom feed.
+
+        Yields:
+            Iterator[Paper]: The papers of the completed entries.
+        """
+        for _, entry in parser.read_events():
+            yield cls._parse_entry(entry)
+
+            # Drop the parsed entry and its already processed siblings
+            entry.clear(keep_tail=True)
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+    @classmethod
+    def parse_papers_info(cls, feed: bytes | Iterable[bytes]) -> list[Paper]:
         """Parse the papers information from the XML response.
 
+        The feed is parsed incrementally: every entry is released as soon as its paper is built,
+        so the full document tree is never kept in memory. When the feed is given as chunks, each
+        chunk is parsed as soon as it arrives.
+
         Args:
-            entities (list[ET.Element]): The list of entities.
+            feed (bytes | Iterable[bytes]): The raw Atom feed, whole or as consecutive chunks.
 
         Returns:
             list[Paper]: The list of papers.
         """
+        parser = etree.XMLPullParser(events=("end",), tag=cls.entry_tag)
         papers: list[Paper] = []
-        for entry in entities:
-            # Extract metadata for each paper
-            paper_id = safe_get_text(entry, f"{self.atom_namespace}id").split("/abs/")[-1]
-            paper_id = re.sub(r"v\d+", "", paper_id)  # remove v{number} from the paper id
-            title = safe_get_text(entry, f"{self.atom_namespace}title").strip().replace("\n", " ")
-            summary = safe_get_text(entry, f"{self.atom_namespace}summary").strip().replace("\n", " ")
-            published = safe_get_text(entry, f"{self.atom_namespace}published")
-            published_date_ts = parser.isoparse(published).timestamp()
-            updated = safe_get_text(entry, f"{self.atom_namespace}updated")
-            updated_date_ts = parser.isoparse(updated).timestamp()
-
-            authors = [
-                safe_get_text(author, f"{self.atom_namespace}name")
-                for author in entry.findall(f"{self.atom_namespace}author")
-            ]
-            authors = self._get_main_authors(authors)
-
-            pdf_link = ""
-            for link in entry.findall(f"{self.atom_namespace}link"):
-                if link.get("title") == "pdf":
-                    pdf_link = link.get("href", "")
-                    break
-
-            primary_category = entry.find("{http://arxiv.org/schemas/atom}primary_category")
-            primary_category_str = primary_category.get("term", "") if primary_category is not None else ""
-
-            papers.append(
-                Paper(
-                    paper_id=paper_id,
-                    title=title,
-                    authors=authors,
-                    summary=summary,
-                    published_date=published,
-                    published_date_ts=published_date_ts,
-                    updated_date=updated,
-                    updated_date_ts=updated_date_ts,
-                    pdf_url=pdf_link,
-                    primary_category=primary_category_str,
-                ),
-            )
+        for chunk in (feed,) if isinstance(feed, bytes) else feed:
+            parser.feed(chunk)
+            papers.extend(cls._iter_parsed_papers(parser))
+        parser.close()
+        papers.extend(cls._iter_parsed_papers(parser))
         return papers
 
-    @classmethod
-    def _extract_arxiv_id(cls, value: str) -> str | None:
-        """Return a normalized arXiv ID if the provided value looks like one.
+    def _get_period_cache_path(
+        self,
+        start_date_obj: datetime,
+        end_date_obj: datetime,
+        categories: list[str],
+    ) -> Path | None:
+        """Return the cache file of a period, or None when caching is disabled.
+
+        Args:
+            start_date_obj (datetime): Start date of the period.
+            end_date_obj (datetime): End date of the period.
+            categories (list[str]): List of arXiv categories searched in.
+
+        Returns:
+            Path | None: Path of the cache file.
+        """
+        if self.cache_dir is None:
+            return None
+        categories_hash = hashlib.sha256(",".join(sorted(categories)).encode()).hexdigest()[:12]
+        return self.cache_dir / f"{start_date_obj:%Y%m%d%H%M%S}_{end_date_obj:%Y%m%d%H%M%S}_{categories_hash}.json"
+
+    def _load_cached_papers(self, cache_path: Path, end_date_obj: datetime) -> list[Paper] | None:
+        """Load the cached papers of a period if the cache is still valid.
+
+        Periods that ended more than `cache_settle_period` ago no longer change and never expire,
+        more recent ones expire after `recent_cache_ttl_seconds`.
 
         Args:
-            value (str): Any string potentially containing an arXiv identifier.
+            cache_path (Path): Path of the cache file.
+            end_date_obj (datetime): End date of the period.
 
         Returns:
-            str | None: A normalized identifier or None when the input is invalid.
+            list[Paper] | None: The cached papers, None on a cache miss.
         """
-        normalized = value.strip()
-        if not normalized:
+        try:
+            cache_age = time.time() - cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        is_settled = end_date_obj < datetime.now(UTC) - self.cache_settle_period
+        if not is_settled and cache_age > self.recent_cache_ttl_seconds:
             return None
-        normalized = re.sub(r"^https?://arxiv\.org/(abs|pdf)/", "", normalized, flags=re.IGNORECASE)
-        normalized = normalized.removeprefix("arXiv:")
-        normalized = normalized.rstrip("/")
-        normalized = normalized.split("?")[0]
-        normalized = normalized.removesuffix(".pdf")
-        if ARXIV_ID_REGEX.match(normalized):
-            return normalized
-        return None
+        logger.info(f"Loading cached papers from {cache_path}")
+        return PAPER_LIST_ADAPTER.validate_json(cache_path.read_bytes())
+
+    @staticmethod
+    def _store_cached_papers(cache_path: Path, papers: list[Paper]) -> None:
+        """Write the papers of a period to its cache file.
+
+        Args:
+            cache_path (Path): Path of the cache file.
+            papers (list[Paper]): The papers of the period.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that readers never see a partially written cache
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(PAPER_LIST_ADAPTER.dump_json(papers))
+        tmp_path.replace(cache_path)
 
     def fetch_papers_for_period(
         self,
@@ -226,41 +408,130 @@ class ArxivFetcher:
             HTTPError: The HTTP error occurred while fetching the papers.
             Exception: The exception occurred while fetching the papers.
         """
+        cache_path = self._get_period_cache_path(start_date_obj, end_date_obj, categories)
+        if cache_path is not None and (cached_papers := self._load_cached_papers(cache_path, end_date_obj)) is not None:
+            return cached_papers
+
         search_query = self._build_arxiv_query(categories, start_date_obj, end_date_obj)
         logger.info(f"Querying for date range: {start_date_obj.date()} to {end_date_obj.date()}")
 
         if end_date_obj - start_date_obj > timedelta(days=3):
             logger.warning("Fetching papers for a period longer than 3 days. API output may be incomplete.")
 
+        url_prefix = self._build_page_url_prefix(search_query)
         papers = []
         start_index = 0
         while True:
-            query_params = {
-                "search_query": search_query,
-                "start": start_index,
-                "max_results": self.page_size,
-                "sortBy": "submittedDate",
-                "sortOrder": "ascending",
-            }
-            url = self.base_url + parse.urlencode(query_params)
-            entities = self._extract_entities(url)
-            if not entities:
+            url = f"{url_prefix}{start_index}"
+            papers_found = self._extract_papers(url)
+            if papers_found is None:
+                # Never cache a period that could not be fetched completely
+                return papers
+            if not papers_found:
                 logger.debug(f"No entities found for query: {url}")
                 break
 
-            papers_found = self.parse_papers_info(entities)
             logger.info(f"Found {len(papers_found)} papers in current batch")
             papers.extend(papers_found)
-            start_index += len(entities)
+            start_index += len(papers_found)
 
             # If we received less papers than requested, this is the last page
-            if len(entities) < self.page_size:
+            if len(papers_found) < self.page_size:
                 break
 
-            # Be polite to the API
-            time.sleep(10)
+        if cache_path is not None:
+            self._store_cached_papers(cache_path, papers)
         return papers
 
+    async def afetch_papers_for_period(
+        self,
+        client: httpx.AsyncClient,
+        start_date_obj: datetime,
+        end_date_obj: datetime,
+        categories: list[str],
+    ) -> list[Paper]:
+        """Fetch papers for a specific and short period without blocking the event loop.
+
+        Args:
+            client (httpx.AsyncClient): The HTTP client to send the requests with.
+            start_date_obj (datetime): Start date for filtering papers.
+            end_date_obj (datetime): End date for filtering papers.
+            categories (list[str]): List of arXiv categories to search in.
+
+        Returns:
+            list[Paper]: The list of papers.
+        """
+        cache_path = self._get_period_cache_path(start_date_obj, end_date_obj, categories)
+        if cache_path is not None:
+            cached_papers = await asyncio.to_thread(self._load_cached_papers, cache_path, end_date_obj)
+            if cached_papers is not None:
+                return cached_papers
+
+        search_query = self._build_arxiv_query(categories, start_date_obj, end_date_obj)
+        logger.info(f"Querying for date range: {start_date_obj.date()} to {end_date_obj.date()}")
+
+        url_prefix = self._build_page_url_prefix(search_query)
+        papers = []
+        start_index = 0
+        while True:
+            url = f"{url_prefix}{start_index}"
+            papers_found = await self._aextract_papers(client, url)
+            if papers_found is None:
+                # Never cache a period that could not be fetched completely
+                return papers
+            if not papers_found:
+                logger.debug(f"No entities found for query: {url}")
+                break
+
+            logger.info(f"Found {len(papers_found)} papers in current batch")
+            papers.extend(papers_found)
+            start_index += len(papers_found)
+
+            # If we received less papers than requested, this is the last page
+            if len(papers_found) < self.page_size:
+                break
+
+        if cache_path is not None:
+            await asyncio.to_thread(self._store_cached_papers, cache_path, papers)
+        return papers
+
+    async def aiter_papers_for_periods(
+        self,
+        periods: list[tuple[datetime, datetime]],
+        categories: list[str],
+    ) -> AsyncIterator[list[Paper]]:
+        """Fetch papers for several periods concurrently over a shared HTTP client.
+
+        At most `max_concurrent_requests` periods are in flight at the same time, and the papers
+        of each period are yielded as soon as the period is fetched, in completion order.
+
+        Args:
+            periods (list[tuple[datetime, datetime]]): The (start, end) periods to fetch.
+            categories (list[str]): List of arXiv categories to search in.
+
+        Yields:
+            AsyncIterator[list[Paper]]: The papers of one period.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent_requests,
+            max_keepalive_connections=self.max_concurrent_requests,
+        )
+        # HTTP/2 is negotiated over TLS, letting concurrent page requests share one connection
+        async with httpx.AsyncClient(
+            timeout=self.request_timeout,
+            limits=limits,
+            follow_redirects=True,
+            http2=True,
+        ) as client:
+
+            async def fetch_period(start_date_obj: datetime, end_date_obj: datetime) -> list[Paper]:
+                async with semaphore:
+                    return await self.afetch_papers_for_period(client, start_date_obj, end_date_obj, categories)
+
+            for next_fetched in asyncio.as_completed([fetch_period(start, end) for start, end in periods]):
+                yield await next_fetched
+
     def extract_paper_by_name_or_id(self, name_or_id: str) -> Paper:
         """Extract a paper by name or ID.
 
@@ -271,7 +542,7 @@ class ArxivFetcher:
             Paper: The paper.
         """
         cleaned_value = name_or_id.strip()
-        arxiv_id = self._extract_arxiv_id(cleaned_value)
+        arxiv_id = extract_arxiv_id(cleaned_value)
         if arxiv_id is not None:
             logger.info(f"Fetching paper by arXiv id: {arxiv_id}")
             query_params = {"id_list": arxiv_id}
@@ -288,22 +559,40 @@ class ArxivFetcher:
                 "sortOrder": "descending",
             }
         url = self.base_url + parse.urlencode(query_params)
-        entities = self._extract_entities(url)
-        if not entities:
+        papers = self._extract_papers(url)
+        if not papers:
             search_target = f"arXiv id '{arxiv_id}'" if arxiv_id else f"title '{cleaned_value}'"
             msg = f"No papers found for {search_target}."
             raise ValueError(msg)
-        return self.parse_papers_info(entities)[0]
+        return papers[0]
 
 
-def fetch_papers_in_chunks(
+async def _anext_papers(papers_by_period: AsyncIterator[list[Paper]]) -> list[Paper] | None:
+    """Return the next batch of an async paper iterator, or None once it is exhausted.
+
+    Args:
+        papers_by_period (AsyncIterator[list[Paper]]): The async iterator to advance.
+
+    Returns:
+        list[Paper] | None: The papers of the next period, None if there are no periods left.
+    """
+    return await anext(papers_by_period, None)
+
+
+def fetch_papers_in_chunks(  # noqa: PLR0913
     start_date_str: str,
     end_date_str: str,
     collection_start_date_str: str | None = None,
     collection_end_date_str: str | None = None,
     categories: list[str] | None = None,
+    *,
+    cache_dir: str | Path | None = None,
 ) -> list[Paper]:
-    """Fetches papers by breaking the date range into daily chunks to avoid API limitations.
+    """Fetches papers by breaking the date range into windows of a few days to avoid API limitations.
+
+    Windows are streamed from `fetch_papers_day_by_day`, which already drops papers seen in an earlier
+    window, so this function must not be called from a running event loop either. Windows arrive in
+    completion order, so the papers are sorted by publication date before being returned.
 
     Args:
         start_date_str (str): Start date (YYYY-MM-DD) for filtering papers.
@@ -311,56 +600,42 @@ def fetch_papers_in_chunks(
         collection_start_date_str (str | None): Start date (YYYY-MM-DD) for filtering papers in the collection.
         collection_end_date_str (str | None): End date (YYYY-MM-DD) for filtering papers in the collection.
         categories (list[str] | None): List of arXiv categories to search in.
+        cache_dir (str | Path | None): Directory caching the papers of every fetched window, disabled when None.
 
     Returns:
-        list[Paper]: The list of papers.
+        list[Paper]: The list of papers, oldest first.
     """
-    fetcher = ArxivFetcher(page_size=500)
-    if categories is None:
-        categories = list(fetcher.predefined_categories)
-
-    start_date_obj, end_date_obj = fetcher.check_start_end_dates_diff(start_date_str, end_date_str)
-    collection_start_date_obj: datetime | None = None
-    collection_end_date_obj: datetime | None = None
-    if collection_start_date_str is not None and collection_end_date_str is not None:
-        collection_start_date_obj, collection_end_date_obj = fetcher.check_start_end_dates_diff(
+    papers = [
+        paper
+        for papers_for_window in fetch_papers_day_by_day(
+            start_date_str,
+            end_date_str,
             collection_start_date_str,
             collection_end_date_str,
+            categories,
+            page_size=500,
+            cache_dir=cache_dir,
         )
+        for paper in papers_for_window
+    ]
+    papers.sort(key=attrgetter("published_date_ts"))
+    return papers
 
-    total_days = count_inclusive_days(start_date_obj, end_date_obj)
-    all_papers: list[Paper] = []
-    for current_start, current_end in tqdm(
-        iter_daily_ranges(start_date_obj, end_date_obj),
-        desc="Fetching papers day by day",
-        total=total_days,
-    ):
-        if should_skip_collection_window(
-            current_start,
-            current_end,
-            collection_start_date_obj,
-            collection_end_date_obj,
-        ):
-            continue
-
-        papers_for_day = fetcher.fetch_papers_for_period(
-            start_date_obj=current_start,
-            end_date_obj=current_end,
-            categories=categories,
-        )
-        all_papers.extend(papers_for_day)
 
-    return deduplicate_papers_by_base_id(all_papers)
-
-
-def fetch_papers_day_by_day(
+def fetch_papers_day_by_day(  # noqa: PLR0913
     start_date_str: str,
     end_date_str: str,
     collection_start_date_str: str | None = None,
     collection_end_date_str: str | None = None,
     categories: list[str] | None = None,
+    *,
+    page_size: int = 150,
+    cache_dir: str | Path | None = None,
 ) -> Iterator[list[Paper]]:
-    """Fetch papers as an iterator, yielding a list (batch) of all unique papers for each day.
+    """Fetch papers as an iterator, yielding a list (batch) of all unique papers for each window of a few days.
+
+    Windows are fetched concurrently and yielded in completion order, so this function must not be
+    iterated from a running event loop.
 
     Args:
         start_date_str (str): Start date (YYYY-MM-DD) for filtering papers.
@@ -368,49 +643,58 @@ def fetch_papers_day_by_day(
         collection_start_date_str (str | None): Start date (YYYY-MM-DD) for filtering papers in the collection.
         collection_end_date_str (str | None): End date (YYYY-MM-DD) for filtering papers in the collection.
         categories (list[str] | None): List of arXiv categories to search in.
+        page_size (int): Number of results requested per page from the arXiv API.
+        cache_dir (str | Path | None): Directory caching the papers of every fetched window, disabled when None.
 
     Yields:
-        Iterator[list[Paper]]: A list of unique Paper objects published on a given day.
+        Iterator[list[Paper]]: A list of unique Paper objects published within one window.
     """
-    fetcher = ArxivFetcher(page_size=150)
-    if categories is None:
-        categories = list(fetcher.predefined_categories)
-
-    start_date_obj, end_date_obj = fetcher.check_start_end_dates_diff(start_date_str, end_date_str)
-    collection_start_date_obj: datetime | None = None
-    collection_end_date_obj: datetime | None = None
-    if collection_start_date_str is not None and collection_end_date_str is not None:
-        collection_start_date_obj, collection_end_date_obj = fetcher.check_start_end_dates_diff(
-            collection_start_date_str,
-            collection_end_date_str,
-        )
+    with ArxivFetcher(
+        page_size=page_size,
+        cache_dir=cache_dir,
+    ) as fetcher:
+        if categories is None:
+            categories = list(fetcher.predefined_categories)
+
+        start_date_obj, end_date_obj = fetcher.check_start_end_dates_diff(start_date_str, end_date_str)
+        collection_start_date_obj: datetime | None = None
+        collection_end_date_obj: datetime | None = None
+        if collection_start_date_str is not None and collection_end_date_str is not None:
+            collection_start_date_obj, collection_end_date_obj = fetcher.check_start_end_dates_diff(
+                collection_start_date_str,
+                collection_end_date_str,
+            )
 
-    total_days = count_inclusive_days(start_date_obj, end_date_obj)
-    for current_start, current_end in tqdm(
-        iter_daily_ranges(start_date_obj, end_date_obj),
-        desc="Fetching paper chunks by day",
-        total=total_days,
-    ):
-        if should_skip_collection_window(
-            current_start,
-            current_end,
+        days_to_fetch = iter_daily_ranges_excluding(
+            start_date_obj,
+            end_date_obj,
             collection_start_date_obj,
             collection_end_date_obj,
-        ):
-            continue
-
-        papers_for_day = fetcher.fetch_papers_for_period(
-            start_date_obj=current_start,
-            end_date_obj=current_end,
-            categories=categories,
         )
-
-        unique_papers_for_day = []
-        for paper in papers_for_day:
-            base_id = get_base_paper_id(paper.paper_id)
-            if base_id not in fetcher.seen_paper_ids:
-                fetcher.seen_paper_ids.add(base_id)
-                unique_papers_for_day.append(paper)
-
-        if unique_papers_for_day:
-            yield unique_papers_for_day
+        windows_to_fetch = list(iter_merged_ranges(days_to_fetch, fetcher.max_window_days))
+        papers_by_window = fetcher.aiter_papers_for_periods(windows_to_fetch, categories)
+        with (
+            asyncio.Runner() as runner,
+            tqdm(
+                desc="Fetching paper chunks by window",
+                total=len(windows_to_fetch),
+                mininterval=fetcher.progress_min_interval,
+                disable=None,
+            ) as progress_bar,
+        ):
+            try:
+                # The loop only runs while the next batch is awaited, so at most
+                # `max_concurrent_requests` windows are fetched ahead of the consumer
+                while (papers_for_window := runner.run(_anext_papers(papers_by_window))) is not None:
+                    progress_bar.update(1)
+                    unique_papers_for_window = []
+                    for paper in papers_for_window:
+                        # Parsed paper ids carry no version suffix, so they are already base ids
+                        if paper.paper_id not in fetcher.seen_paper_ids:
+                            fetcher.seen_paper_ids.add(paper.paper_id)
+                            unique_papers_for_window.append(paper)
+
+                    if unique_papers_for_window:
+                        yield unique_papers_for_window
+            finally:
+                runner.run(papers_by_window.aclose())
@@ -1,11 +1,9 @@
 """arXiv utilities."""
 
+import functools
 import re
 from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
-from xml.etree import ElementTree as ET
-
-from src.utils.schemas import Paper
 
 ARXIV_ID_REGEX = re.compile(
     r"""
@@ -20,44 +18,59 @@ ARXIV_ID_REGEX = re.compile(
     re.IGNORECASE | re.VERBOSE,
 )
 
+ARXIV_INPUT_REGEX = re.compile(
+    r"""
+        ^\s*
+        (?:https?://arxiv\.org/(?:abs|pdf)/|arXiv:)?  # Optional URL or "arXiv:" prefix
+        (?P<id>[^?]*?)  # Candidate identifier
+        (?:\.pdf)?/*  # Optional ".pdf" suffix and trailing slashes
+        (?:\?.*)?  # Optional query string
+        \s*$
+        """,
+    re.IGNORECASE | re.VERBOSE,
+)
 
-def safe_get_text(element: ET.Element, tag: str, default: str = "") -> str:
-    """Get the text of an element, or return a default value if the element is not found.
+WHITESPACE_REGEX = re.compile(r"\s+")
 
-    Args:
-        element (ET.Element): The element to get the text from.
-        tag (str): The tag of the element to get the text from.
-        default (str): The default value to return if the element is not found.
+VERSION_SUFFIX_REGEX = re.compile(r"v\d+$")
 
-    Returns:
-        str: Text contained in the requested tag or the provided default.
-    """
-    found_element = element.find(tag)
-    return found_element.text if found_element is not None else default  # type: ignore
 
+@functools.lru_cache(maxsize=4096)
+def extract_arxiv_id(value: str) -> str | None:
+    """Return a normalized arXiv ID if the provided value looks like one.
 
-def count_inclusive_days(start_date_obj: datetime, end_date_obj: datetime) -> int:
-    """Return the inclusive number of days between two datetimes.
+    Results are memoized, since the same identifiers tend to be looked up repeatedly.
 
     Args:
-        start_date_obj (datetime): Start of the interval.
-        end_date_obj (datetime): End of the interval.
+        value (str): Any string potentially containing an arXiv identifier.
 
     Returns:
-        int: Total number of days, including both bounds.
+        str | None: A normalized identifier or None when the input is invalid.
     """
-    return (end_date_obj - start_date_obj).days + 1
+    match = ARXIV_INPUT_REGEX.match(value)
+    if match is None:
+        return None
+    normalized = match.group("id")
+    if ARXIV_ID_REGEX.match(normalized):
+        return normalized
+    return None
 
 
-def iter_daily_ranges(
+def iter_daily_ranges_excluding(
     start_date_obj: datetime,
     end_date_obj: datetime,
+    collection_start: datetime | None,
+    collection_end: datetime | None,
 ) -> Iterator[tuple[datetime, datetime]]:
-    """Yield (start, end) datetimes that cover each day in the interval.
+    """Yield (start, end) datetimes for each day in the interval that is not inside the collection window.
+
+    Days covered by the collection window are jumped over at once instead of being generated and discarded.
 
     Args:
         start_date_obj (datetime): Inclusive lower bound of the period.
         end_date_obj (datetime): Inclusive upper bound of the period.
+        collection_start (datetime | None): Start of the exclusion window.
+        collection_end (datetime | None): End of the exclusion window.
 
     Yields:
         Iterator[tuple[datetime, datetime]]: Tuples describing one day's time span.
@@ -65,10 +78,47 @@ def iter_daily_ranges(
     current_start = start_date_obj
     while current_start <= end_date_obj:
         current_end = min(end_date_obj, current_start + timedelta(days=1) - timedelta(seconds=1))
+        if collection_end is not None and should_skip_collection_window(
+            current_start,
+            current_end,
+            collection_start,
+            collection_end,
+        ):
+            # The first day ending after the collection window is the next one to fetch
+            current_start += timedelta(days=(collection_end.date() - current_end.date()).days + 1)
+            continue
         yield current_start, current_end
         current_start += timedelta(days=1)
 
 
+def iter_merged_ranges(
+    ranges: Iterable[tuple[datetime, datetime]],
+    max_days: int,
+) -> Iterator[tuple[datetime, datetime]]:
+    """Merge back-to-back daily ranges into windows spanning at most `max_days` days.
+
+    Args:
+        ranges (Iterable[tuple[datetime, datetime]]): Ordered daily (start, end) ranges.
+        max_days (int): Maximum number of days covered by one merged window.
+
+    Yields:
+        Iterator[tuple[datetime, datetime]]: Merged (start, end) windows. Ranges separated by a gap are never merged.
+    """
+    window: tuple[datetime, datetime] | None = None
+    window_days = 0
+    for range_start, range_end in ranges:
+        if window is not None and window_days < max_days and range_start - window[1] <= timedelta(seconds=1):
+            window = (window[0], range_end)
+            window_days += 1
+            continue
+        if window is not None:
+            yield window
+        window = (range_start, range_end)
+        window_days = 1
+    if window is not None:
+        yield window
+
+
 def should_skip_collection_window(
     window_start: datetime,
     window_end: datetime,
@@ -89,31 +139,3 @@ def should_skip_collection_window(
     if collection_start is None or collection_end is None:
         return False
     return collection_start.date() <= window_start.date() and window_end.date() <= collection_end.date()
-
-
-def get_base_paper_id(paper_id: str) -> str:
-    """Return the base arXiv identifier (without version suffix).
-
-    Args:
-        paper_id (str): The arXiv identifier, possibly with a version suffix.
-
-    Returns:
-        str: The identifier stripped of any version suffix.
-    """
-    return paper_id.split("v", 1)[0]
-
-
-def deduplicate_papers_by_base_id(papers: Iterable[Paper]) -> list[Paper]:
-    """Return papers with the latest version for each base arXiv id.
-
-    Args:
-        papers (Iterable[Paper]): Papers potentially containing multiple versions.
-
-    Returns:
-        list[Paper]: One paper per base id, keeping the last occurrence.
-    """
-    unique_by_id: dict[str, Paper] = {}
-    for paper in papers:
-        base_id = get_base_paper_id(paper.paper_id)
-        unique_by_id[base_id] = paper
-    return list(unique_by_id.values())
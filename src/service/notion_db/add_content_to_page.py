@@ -1,16 +1,25 @@
 """Upload a Markdown file to a Notion database page."""
 
-import os
+import ast
 import re
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
-from typing import Any
+from itertools import batched, chain
+from pathlib import PurePath
+from typing import Any, ClassVar
 
+import orjson
 import requests
 from loguru import logger
+from urllib3.util.retry import Retry
 
 from src.service.notion_db.s3_loader import S3Uploader
-from src.service.notion_db.utils import resolve_image_path
+from src.service.notion_db.utils import RateLimitedAdapter, resolve_image_path
 from src.settings import settings
+from src.utils.rate_limiter import RequestRateLimiter
 
 
 class EmptyMarkdownTitleError(ValueError):
@@ -29,8 +38,48 @@ class MarkdownToNotionUploader:
         database_id (str): Notion database ID.
         base_url (str): Notion API base URL.
         headers (dict): Notion API headers.
+        session (requests.Session): Keep-alive HTTP session sending the Notion API requests.
     """
 
+    # Combined pattern for bold (**text**) and inline equations ($equation$)
+    # Use negative lookbehind to avoid matching escaped dollars (\$)
+    # For inline equations: match $...$ but not $$ (block equation markers)
+    # The (?<![^$]\$) lookbehind prevents matching when preceded by non-$ followed by $
+    # This handles: $$block$$ (don't match) vs $a$$b$ (match both)
+    rich_text_regex: re.Pattern[str] = re.compile(r"(\*\*(.+?)\*\*)|(?<!\\)(?<!\$)\$(?!\$)([^$]+?)\$")
+    # Annotations shared by every bold segment, they are only ever serialized
+    bold_annotations: ClassVar[dict[str, Any]] = {
+        "bold": True,
+        "italic": False,
+        "strikethrough": False,
+        "underline": False,
+        "code": False,
+        "color": "default",
+    }
+
+    # Heading block types keyed by the "#" marker opening the heading line
+    heading_types: ClassVar[dict[str, str]] = {"#": "heading_1", "##": "heading_2", "###": "heading_3"}
+    # Notion rejects requests carrying more children blocks than this
+    max_blocks_per_request: int = 100
+    # Notion rejects blocks carrying more rich text objects than this
+    max_rich_text_per_block: int = 100
+    # Joins the lines of a paragraph, it is only ever serialized
+    line_break: ClassVar[dict[str, Any]] = {"type": "text", "text": {"content": "\n"}}
+    # Notion rejects compound filters with more conditions than this, it is also the largest page size
+    max_filter_conditions: int = 100
+    image_upload_workers: int = 4
+    # Number of found paper pages remembered by `find_paper_page`
+    paper_page_cache_size: int = 2048
+    # Seconds a found paper page is trusted before Notion is queried again, pages may be edited in Notion
+    paper_page_cache_ttl: float = 600.0
+    # Pooled connections kept alive per host, enough for the image upload threads plus the main thread
+    max_pooled_connections: int = 8
+    # Only statuses Notion returns before applying a request are retried. Read errors are never retried,
+    # since a POST/PATCH that timed out may already have been applied and would be replayed
+    retry_status_codes: tuple[int, ...] = (429, 503)
+    # Notion allows an average of three requests per second per integration
+    min_request_interval: float = 1 / 3
+
     def __init__(self, database_id: str = "228f6f75bb0b80babf73d46a6254a459") -> None:
         """Initialize the uploader with the provided database ID.
 
@@ -45,7 +94,69 @@ class MarkdownToNotionUploader:
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json",
         }
+        # Keep-alive session reused across all Notion API requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            RateLimitedAdapter(
+                RequestRateLimiter(self.min_request_interval),
+                pool_maxsize=self.max_pooled_connections,
+                max_retries=Retry(
+                    total=5,
+                    read=0,
+                    backoff_factor=0.5,
+                    status_forcelist=self.retry_status_codes,
+                    allowed_methods=("GET", "POST", "PATCH"),
+                    raise_on_status=False,
+                ),
+            ),
+        )
         self.bucket = S3Uploader()
+        # Images are uploaded to S3 in the background while the markdown is still being converted
+        self._image_upload_executor = ThreadPoolExecutor(
+            max_workers=self.image_upload_workers,
+            thread_name_prefix="notion-image-upload",
+        )
+        # Found pages as (expires_at, page_id, page_url, categories) keyed by their "Arxiv" property URL.
+        # Misses are not cached, so pages created later in the process are still found
+        self._paper_pages: dict[str, tuple[float, str, str, tuple[str, ...]]] = {}
+        # Workflow threads and image upload workers share the uploader, so the page cache is guarded
+        self._paper_pages_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Wait for pending image uploads and close the pooled Notion connections."""
+        self._image_upload_executor.shutdown(wait=True)
+        self.session.close()
+
+    @staticmethod
+    def _to_arxiv_property_url(arxiv_url: str) -> str:
+        """Normalize an arXiv id or URL to the value stored in the Notion "Arxiv" URL property.
+
+        Args:
+            arxiv_url (str): Either a raw arXiv id (e.g. "2601.02242") or a full URL.
+
+        Returns:
+            str: The URL as stored in Notion.
+        """
+        return (
+            arxiv_url if arxiv_url.startswith(("http://", "https://")) else f"https://www.alphaxiv.org/abs/{arxiv_url}"
+        )
+
+    @staticmethod
+    def _extract_categories(page: dict[str, Any]) -> list[str]:
+        """Extract the category names of a page from its multi_select Category property.
+
+        Args:
+            page (dict[str, Any]): The Notion page object.
+
+        Returns:
+            list[str]: The non-empty category names, empty if the property is missing or of another type.
+        """
+        category_prop = page.get("properties", {}).get("Category", {})
+        if category_prop.get("type") != "multi_select":
+            return []
+        return [name for item in category_prop.get("multi_select", []) if (name := item.get("name"))]
 
     def find_paper_page_url(self, arxiv_url: str, category: str | None = None) -> str | None:
         """Find an existing Notion page URL for a paper by its ArXiv (AlphaXiv) URL/id.
@@ -58,40 +169,51 @@ class MarkdownToNotionUploader:
         Returns:
             The Notion page URL if found, otherwise None.
         """
-        url = f"{self.base_url}/databases/{self.database_id}/query"
-        expected_url = (
-            arxiv_url if arxiv_url.startswith(("http://", "https://")) else f"https://www.alphaxiv.org/abs/{arxiv_url}"
-        )
-        arxiv_filter: dict[str, Any] = {
-            "property": "Arxiv",
-            "url": {"equals": expected_url},
-        }
+        return self.find_paper_pages_bulk([arxiv_url], category)[arxiv_url]
 
-        # If category is provided, ensure we only match pages with the same Category value.
-        if category is not None:
-            payload: dict[str, Any] = {
-                "filter": {
+    def find_paper_pages_bulk(self, arxiv_urls: list[str], category: str | None = None) -> dict[str, str | None]:
+        """Find the existing Notion page URLs of several papers with one database query per chunk of URLs.
+
+        Args:
+            arxiv_urls (list[str]): Raw arXiv ids or full URL values stored in the Notion "Arxiv" URL property.
+            category (str | None): The category of the papers to filter by.
+
+        Returns:
+            dict[str, str | None]: The Notion page URL of every input, None when no page was found.
+        """
+        url = f"{self.base_url}/databases/{self.database_id}/query"
+        expected_urls = {arxiv_url: self._to_arxiv_property_url(arxiv_url) for arxiv_url in arxiv_urls}
+        page_urls: dict[str, str] = {}
+        for urls_chunk in batched(dict.fromkeys(expected_urls.values()), self.max_filter_conditions):
+            arxiv_filter: dict[str, Any] = {
+                "or": [{"property": "Arxiv", "url": {"equals": expected_url}} for expected_url in urls_chunk],
+            }
+            # If category is provided, ensure we only match pages with the same Category value.
+            if category is not None:
+                arxiv_filter = {
                     "and": [
                         arxiv_filter,
                         {"property": "Category", "multi_select": {"contains": category}},
                     ],
-                },
-            }
-        else:
-            payload = {"filter": arxiv_filter}
-        try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            results = data.get("results", []) or []
-            if not results:
-                return None
-            # Notion returns the page URL at the top level.
-            page_url = results[0].get("url")
-            return page_url if isinstance(page_url, str) and page_url else None
-        except Exception as exp:
-            logger.error(f"Error checking if paper exists: {exp}")
-            return None
+                }
+            payload: dict[str, Any] = {"filter": arxiv_filter, "page_size": self.max_filter_conditions}
+            try:
+                while True:
+                    response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
+                    response.raise_for_status()
+                    data = orjson.loads(response.content)
+                    for page in data.get("results", []) or []:
+                        arxiv_value = page.get("properties", {}).get("Arxiv", {}).get("url")
+                        # Notion returns the page URL at the top level.
+                        page_url = page.get("url")
+                        if isinstance(arxiv_value, str) and isinstance(page_url, str) and page_url:
+                            page_urls.setdefault(arxiv_value, page_url)
+                    if not data.get("has_more"):
+                        break
+                    payload["start_cursor"] = data["next_cursor"]
+            except Exception as exp:
+                logger.error(f"Error checking if papers exist: {exp}")
+        return {arxiv_url: page_urls.get(expected_url) for arxiv_url, expected_url in expected_urls.items()}
 
     def find_paper_page(self, arxiv_url: str) -> dict[str, Any] | None:
         """Find an existing Notion page for a paper by its ArXiv URL/id.
@@ -101,13 +223,25 @@ class MarkdownToNotionUploader:
                 that is stored in the Notion "Arxiv" URL property.
 
         Returns:
-            A dict with 'page_id', 'page_url', and 'categories' (list of str) if found,
-            otherwise None.
+            A dict with 'page_id', 'page_url', 'categories' (list of str) and 'cached' (True when served
+            from the cache, so the categories may be stale) if found, otherwise None.
         """
+        expected_url = self._to_arxiv_property_url(arxiv_url)
+        with self._paper_pages_lock:
+            cached_page = self._paper_pages.get(expected_url)
+            if cached_page is not None and time.monotonic() >= cached_page[0]:
+                self._paper_pages.pop(expected_url, None)
+                cached_page = None
+        if cached_page is not None:
+            _, page_id, page_url, cached_categories = cached_page
+            return {
+                "page_id": page_id,
+                "page_url": page_url,
+                "categories": list(cached_categories),
+                "cached": True,
+            }
+
         url = f"{self.base_url}/databases/{self.database_id}/query"
-        expected_url = (
-            arxiv_url if arxiv_url.startswith(("http://", "https://")) else f"https://www.alphaxiv.org/abs/{arxiv_url}"
-        )
         payload: dict[str, Any] = {
             "filter": {
                 "property": "Arxiv",
@@ -115,9 +249,9 @@ class MarkdownToNotionUploader:
             },
         }
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=30)
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", []) or []
             if not results:
                 return None
@@ -126,51 +260,51 @@ class MarkdownToNotionUploader:
             page_id = page.get("id")
             page_url = page.get("url")
 
-            # Extract existing categories from multi_select property
-            categories: list[str] = []
-            props = page.get("properties", {})
-            category_prop = props.get("Category", {})
-            if category_prop.get("type") == "multi_select":
-                for item in category_prop.get("multi_select", []):
-                    name = item.get("name")
-                    if name:
-                        categories.append(name)
+            categories = self._extract_categories(page)
         except Exception as exp:
             logger.error(f"Error finding paper page: {exp}")
             return None
         else:
+            expires_at = time.monotonic() + self.paper_page_cache_ttl
+            with self._paper_pages_lock:
+                if expected_url not in self._paper_pages and len(self._paper_pages) >= self.paper_page_cache_size:
+                    # Evict the oldest entry, dicts keep insertion order
+                    self._paper_pages.pop(next(iter(self._paper_pages)), None)
+                self._paper_pages[expected_url] = (expires_at, page_id, page_url, tuple(categories))
             return {
                 "page_id": page_id,
                 "page_url": page_url,
                 "categories": categories,
+                "cached": False,
             }
 
-    def add_category_to_page(self, page_id: str, category: str) -> bool:
+    def add_category_to_page(
+        self,
+        page_id: str,
+        category: str,
+        existing_categories: list[str] | None = None,
+    ) -> bool:
         """Add a category to an existing Notion page's multi_select Category property.
 
         Args:
             page_id: The Notion page ID.
             category: The category name to add.
+            existing_categories: The categories currently set on the page, freshly read from Notion.
+                When provided, the page is updated without fetching its categories first. The whole
+                multi_select is overwritten, so categories that may be stale must not be passed.
 
         Returns:
             True if successful, False otherwise.
         """
-        # First, fetch current categories
         url = f"{self.base_url}/pages/{page_id}"
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            page = response.json()
-
-            # Extract existing categories
-            existing_categories: list[str] = []
-            props = page.get("properties", {})
-            category_prop = props.get("Category", {})
-            if category_prop.get("type") == "multi_select":
-                for item in category_prop.get("multi_select", []):
-                    name = item.get("name")
-                    if name:
-                        existing_categories.append(name)
+            if existing_categories is None:
+                # First, fetch current categories
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                existing_categories = self._extract_categories(orjson.loads(response.content))
+            else:
+                existing_categories = list(existing_categories)
 
             # Check if category already exists
             if category in existing_categories:
@@ -186,15 +320,28 @@ class MarkdownToNotionUploader:
                     "Category": {"multi_select": [{"name": cat} for cat in existing_categories]},
                 },
             }
-            update_response = requests.patch(url, headers=self.headers, json=update_payload, timeout=30)
+            update_response = self.session.patch(url, data=orjson.dumps(update_payload), timeout=30)
             update_response.raise_for_status()
             logger.info(f"Added category '{category}' to page {page_id}")
+            self._update_cached_categories(page_id, existing_categories)
         except Exception as exp:
             logger.error(f"Error adding category to page {page_id}: {exp}")
             return False
         else:
             return True
 
+    def _update_cached_categories(self, page_id: str, categories: list[str]) -> None:
+        """Replace the categories remembered for a page after they were updated in Notion.
+
+        Args:
+            page_id (str): The Notion page ID.
+            categories (list[str]): The categories now set on the page.
+        """
+        with self._paper_pages_lock:
+            for expected_url, (expires_at, cached_page_id, page_url, _) in list(self._paper_pages.items()):
+                if cached_page_id == page_id:
+                    self._paper_pages[expected_url] = (expires_at, page_id, page_url, tuple(categories))
+
     def _parse_rich_text(self, line: str) -> list[dict[str, Any]]:
         """Parse a line for **bold** markdown and $inline equations$ and return Notion rich_text objects.
 
@@ -204,18 +351,14 @@ class MarkdownToNotionUploader:
         Returns:
             List[Dict[str, Any]]: List of Notion rich_text objects.
         """
-        segments: list[dict[str, Any]] = []
+        # Most prose has neither bold nor equation markers, so it skips the regex scan
+        if "*" not in line and "$" not in line:
+            return [{"type": "text", "text": {"content": line}}]
 
-        # Combined pattern for bold (**text**) and inline equations ($equation$)
-        # Use negative lookbehind to avoid matching escaped dollars (\$)
-        # For inline equations: match $...$ but not $$ (block equation markers)
-        # The (?<![^$]\$) lookbehind prevents matching when preceded by non-$ followed by $
-        # This handles: $$block$$ (don't match) vs $a$$b$ (match both)
-        # Pattern matches: **bold** or $equation$
-        combined_pattern = r"(\*\*(.+?)\*\*)|(?<!\\)(?<!\$)\$(?!\$)([^$]+?)\$"
+        segments: list[dict[str, Any]] = []
 
         last_end = 0
-        for match in re.finditer(combined_pattern, line):
+        for match in self.rich_text_regex.finditer(line):
             # Add normal text before the match
             if match.start() > last_end:
                 text = line[last_end : match.start()]
@@ -228,14 +371,7 @@ class MarkdownToNotionUploader:
                     {
                         "type": "text",
                         "text": {"content": bold_text},
-                        "annotations": {
-                            "bold": True,
-                            "italic": False,
-                            "strikethrough": False,
-                            "underline": False,
-                            "code": False,
-                            "color": "default",
-                        },
+                        "annotations": self.bold_annotations,
                     },
                 )
             elif match.group(3):  # Equation match (group 3 is the equation content)
@@ -271,74 +407,50 @@ class MarkdownToNotionUploader:
         Returns:
             bool: True if the line is a heading, False otherwise.
         """
-        if line.startswith("# "):
-            blocks.append(
-                {
-                    "object": "block",
-                    "type": "heading_1",
-                    "heading_1": {"rich_text": [{"type": "text", "text": {"content": line[2:]}}]},
-                },
-            )
-            return True
-        if line.startswith("## "):
-            blocks.append(
-                {
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {"rich_text": [{"type": "text", "text": {"content": line[3:]}}]},
-                },
-            )
-            return True
-        if line.startswith("### "):
-            blocks.append(
-                {
-                    "object": "block",
-                    "type": "heading_3",
-                    "heading_3": {"rich_text": [{"type": "text", "text": {"content": line[4:]}}]},
-                },
-            )
-            return True
-        return False
-
-    def _remove_meta_lines(self, line: str, *, lines_to_remove: bool) -> tuple[bool, bool]:
-        """Check whether the line is a meta line.
-
-        Args:
-            line (str): Line of text to parse.
-            lines_to_remove (bool): True if we in the meta lines block, False otherwise.
-
-        Returns:
-            tuple[bool, bool]: Should we skip the line, and whether we are in the meta lines block.
-        """
-        if line.startswith("---") and lines_to_remove:  # end of meta lines block
-            lines_to_remove = False
-            return True, lines_to_remove  # skip the line and end the meta lines block
-
-        if line.startswith("---"):  # start of meta lines block
-            lines_to_remove = True
-            return True, lines_to_remove  # skip the line and start the meta lines block
-
-        if lines_to_remove:
-            return True, lines_to_remove  # skip the line and continue
+        if not line.startswith("#"):
+            return False
+        marker, separator, text = line.partition(" ")
+        heading_type = self.heading_types.get(marker)
+        if not separator or heading_type is None:
+            return False
+        blocks.append(
+            {
+                "object": "block",
+                "type": heading_type,
+                heading_type: {"rich_text": [{"type": "text", "text": {"content": text}}]},
+            },
+        )
+        return True
 
-        return False, lines_to_remove  # don't skip the line and continue
+    def _upload_image(
+        self,
+        local_path: str,
+        blocks: list[dict[str, Any]],
+        pending_uploads: list[tuple[dict[str, str], Future[str]]],
+    ) -> None:
+        """Start uploading an image to S3 and add its block to the blocks.
 
-    def _upload_image(self, local_path: str, blocks: list[dict[str, Any]]) -> None:
-        """Upload an image to S3 and add it to the blocks.
+        The block URL is filled in once the upload finishes, see `markdown_to_blocks`.
 
         Args:
             local_path (str): Path to the image.
             blocks (list[dict[str, Any]]): List of Notion blocks.
+            pending_uploads (list[tuple[dict[str, str], Future[str]]]): Pending uploads with the
+                external image objects waiting for their public URL.
         """
-        s3_key = os.path.join(*os.path.normpath(local_path).split(os.sep)[-2:])  # noqa: PTH206
-        public_url = self.bucket.upload_file(local_path, s3_key)
+        # S3 keys always use forward slashes, whatever the local path separator
+        s3_key = "/".join(PurePath(local_path).parts[-2:])
+        external_image: dict[str, str] = {"url": ""}
+        pending_uploads.append(
+            (external_image, self._image_upload_executor.submit(self.bucket.upload_file, local_path, s3_key)),
+        )
         blocks.append(
             {
                 "object": "block",
                 "type": "image",
                 "image": {
                     "type": "external",
-                    "external": {"url": public_url},
+                    "external": external_image,
                 },
             },
         )
@@ -362,12 +474,12 @@ class MarkdownToNotionUploader:
 
     def markdown_to_blocks(  # noqa: PLR0912, PLR0915
         self,
-        markdown: str,
+        markdown: str | Iterable[str],
     ) -> tuple[list[dict[str, Any]], str, str, str, list[str]]:
         """Convert basic Markdown text to Notion blocks. Support headings, paragraphs, bullet points, equations.
 
         Args:
-            markdown (str): Markdown text to convert.
+            markdown (str | Iterable[str]): Markdown text to convert, or its lines, e.g. an open file.
 
         Returns:
             List[Dict[str, Any]]: List of Notion blocks.
@@ -376,9 +488,9 @@ class MarkdownToNotionUploader:
             str: Title.
             list[str]: Authors.
         """
-        lines = markdown.splitlines()
+        # Lines of an open file are read one at a time, trailing newlines are stripped below
+        lines = iter(markdown.splitlines() if isinstance(markdown, str) else markdown)
         blocks: list[dict[str, Any]] = []
-        lines_to_remove = False
         first_heading = True
         title = ""
         arxiv_url = ""
@@ -388,14 +500,22 @@ class MarkdownToNotionUploader:
         # State for multi-line block equations
         in_block_equation = False
         block_equation_lines: list[str] = []
+        pending_uploads: list[tuple[dict[str, str], Future[str]]] = []
+
+        # Skip the front matter block, delimited by "---" lines, once before the body
+        first_line = next(lines, "")
+        if first_line.startswith("---"):
+            for line in lines:
+                if line.startswith("---"):
+                    break
+        else:
+            lines = chain((first_line,), lines)
 
+        # Rich text of the paragraph started by the previous line, which the next prose line continues
+        open_paragraph: list[dict[str, Any]] | None = None
         for line in lines:
             line = line.rstrip()  # noqa: PLW2901
-
-            # Check if the line is a meta line
-            skip_line, lines_to_remove = self._remove_meta_lines(line, lines_to_remove=lines_to_remove)
-            if skip_line:
-                continue
+            previous_paragraph, open_paragraph = open_paragraph, None
 
             # Handle multi-line block equations
             if in_block_equation:
@@ -413,47 +533,61 @@ class MarkdownToNotionUploader:
                     block_equation_lines.append(line)
                 continue
 
-            # Check for single-line block equation: $$...$$
-            # Minimum length for valid block equation is 5 (e.g., "$$x$$")
-            min_block_equation_len = 5
-            if line.startswith("$$") and line.endswith("$$") and len(line) >= min_block_equation_len:
-                expression = line[2:-2]
-                self._add_equation_block(expression, blocks)
-                continue
-
-            # Check for start of multi-line block equation
-            if line == "$$" or (line.startswith("$$") and not line.endswith("$$")):
-                in_block_equation = True
-                if line != "$$":
-                    # Line has content after opening $$
-                    block_equation_lines.append(line[2:])
-                continue
-
-            if first_heading and line.startswith("## "):
-                first_heading = False
-                title = line[3:]
-                continue
-
-            if line.startswith("**ArXiv URL:**"):
-                arxiv_url = line.split("**ArXiv URL:**")[1].strip()
+            # Blank lines dominate markdown and never produce a block
+            if not line:
                 continue
 
-            if line.startswith("**Published Date:**"):
-                published_date = line.split("**Published Date:**")[1].strip()
-                continue
-
-            if line.startswith("**Authors:**"):
-                try:
-                    authors = eval(line.split("**Authors:**")[1].strip())  # noqa: S307
-                except Exception as exp:
-                    logger.warning(f"Error parsing authors: {exp}")
-                    authors = []
-                continue
+            # Every special line is recognized by its first character, so plain prose skips the prefix checks
+            first_char = line[0]
+            if first_char == "$":
+                # Check for single-line block equation: $$...$$
+                # Minimum length for valid block equation is 5 (e.g., "$$x$$")
+                min_block_equation_len = 5
+                if line.startswith("$$") and line.endswith("$$") and len(line) >= min_block_equation_len:
+                    expression = line[2:-2]
+                    self._add_equation_block(expression, blocks)
+                    continue
+
+                # Check for start of multi-line block equation
+                if line == "$$" or (line.startswith("$$") and not line.endswith("$$")):
+                    in_block_equation = True
+                    if line != "$$":
+                        # Line has content after opening $$
+                        block_equation_lines.append(line[2:])
+                    continue
+
+            elif first_char == "#":
+                if first_heading and line.startswith("## "):
+                    first_heading = False
+                    title = line[3:]
+                    continue
+
+            elif first_char == "-":
+                # Horizontal rules have no block of their own
+                if line.startswith("---"):
+                    continue
+
+            # Meta lines only appear in the header, before the first content block
+            elif first_char == "*" and not blocks:
+                if line.startswith("**ArXiv URL:**"):
+                    arxiv_url = line.removeprefix("**ArXiv URL:**").strip()
+                    continue
+
+                if line.startswith("**Published Date:**"):
+                    published_date = line.removeprefix("**Published Date:**").strip()
+                    continue
+
+                if line.startswith("**Authors:**"):
+                    try:
+                        authors = ast.literal_eval(line.removeprefix("**Authors:**").strip())
+                    except Exception as exp:
+                        logger.warning(f"Error parsing authors: {exp}")
+                        authors = []
+                    continue
 
             # Parse images
-            local_path = resolve_image_path(line)
-            if local_path:
-                self._upload_image(local_path, blocks)
+            if "relative_url" in line and (local_path := resolve_image_path(line)):
+                self._upload_image(local_path, blocks, pending_uploads)
                 continue
 
             # Parse headings
@@ -461,7 +595,7 @@ class MarkdownToNotionUploader:
                 continue
 
             # Parse bullet points
-            if line.startswith(("- ", "* ")):
+            if line[:2] in {"- ", "* "}:
                 # Bullet list item
                 blocks.append(
                     {
@@ -470,20 +604,25 @@ class MarkdownToNotionUploader:
                         "bulleted_list_item": {"rich_text": self._parse_rich_text(line[2:])},
                     },
                 )
-            elif line == "":
-                continue
             else:
-                # Parse paragraphs
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {"rich_text": self._parse_rich_text(line)},
-                    },
-                )
+                # Parse paragraphs, consecutive prose lines share one block separated by line breaks
+                rich_text = self._parse_rich_text(line)
+                if (
+                    previous_paragraph is not None
+                    and len(previous_paragraph) + len(rich_text) < self.max_rich_text_per_block
+                ):
+                    previous_paragraph.append(self.line_break)
+                    previous_paragraph.extend(rich_text)
+                    open_paragraph = previous_paragraph
+                else:
+                    blocks.append({"object": "block", "type": "paragraph", "paragraph": {"rich_text": rich_text}})
+                    open_paragraph = rich_text
+
+        for external_image, upload in pending_uploads:
+            external_image["url"] = upload.result()
         return blocks, arxiv_url, published_date, title, authors
 
-    def upload_markdown_file(
+    def upload_markdown_file(  # noqa: PLR0912
         self,
         file_path: str,
         category: str = "Image Editing",
@@ -502,9 +641,7 @@ class MarkdownToNotionUploader:
             str: URL of the created Notion page.
         """
         with open(file_path, encoding="utf-8") as file:
-            markdown = file.read()
-
-        blocks, arxiv_url, published_date, title, authors = self.markdown_to_blocks(markdown)
+            blocks, arxiv_url, published_date, title, authors = self.markdown_to_blocks(file)
 
         # Notion is strict about property payloads:
         # - Title content cannot be empty
@@ -553,11 +690,11 @@ class MarkdownToNotionUploader:
         data = {
             "parent": {"database_id": self.database_id},
             "properties": {"Paper name": {"title": [{"text": {"content": title}}]}, **properties},
-            "children": blocks,
+            "children": blocks[: self.max_blocks_per_request],
         }
         url = f"{self.base_url}/pages"
 
-        response = requests.post(url, headers=self.headers, json=data, timeout=60)
+        response = self.session.post(url, data=orjson.dumps(data), timeout=60)
         if not response.ok:
             # Notion includes the actual validation error details in the response body; log them for debugging.
             logger.error(
@@ -565,5 +702,24 @@ class MarkdownToNotionUploader:
                 f"(status={response.status_code}, url={url}, body={response.text}, payload={data})",
             )
         response.raise_for_status()
-        page = response.json()
+        page = orjson.loads(response.content)
+
+        # Blocks beyond the first request are appended in order, one batch at a time
+        for blocks_batch in batched(blocks[self.max_blocks_per_request :], self.max_blocks_per_request):
+            self._append_blocks(page["id"], list(blocks_batch))
         return page.get("url", "")
+
+    def _append_blocks(self, block_id: str, blocks: list[dict[str, Any]]) -> None:
+        """Append children blocks to an existing Notion block or page.
+
+        Args:
+            block_id (str): ID of the parent block or page.
+            blocks (list[dict[str, Any]]): Blocks to append, at most `max_blocks_per_request`.
+        """
+        url = f"{self.base_url}/blocks/{block_id}/children"
+        response = self.session.patch(url, data=orjson.dumps({"children": blocks}), timeout=60)
+        if not response.ok:
+            logger.error(
+                f"Notion append blocks failed (status={response.status_code}, url={url}, body={response.text})",
+            )
+        response.raise_for_status()
@@ -5,6 +5,7 @@ Link to API page: https://www.notion.so/profile/integrations/internal/4332f261-a
 
 from typing import Any
 
+import orjson
 import requests
 
 from src.settings import settings
@@ -17,6 +18,7 @@ class NotionPageExtractor:
         api_token (str): Integration token for authenticating with the Notion API.
         base_url (str): Base URL for Notion API endpoints.
         headers (dict): Headers for the Notion API requests.
+        session (requests.Session): Keep-alive HTTP session sending the Notion API requests.
 
     Methods:
         get_page(page_id): Returns page properties as a dictionary.
@@ -33,6 +35,9 @@ class NotionPageExtractor:
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json",
         }
+        # Keep-alive session reused across all Notion API requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def get_page(self, page_id: str) -> dict[str, Any]:
         """Fetch the properties of a Notion page.
@@ -44,9 +49,9 @@ class NotionPageExtractor:
             dict: Dictionary of page properties.
         """
         url = f"{self.base_url}/pages/{page_id}"
-        response = requests.get(url, headers=self.headers, timeout=60)
+        response = self.session.get(url, timeout=60)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def get_blocks(self, page_id: str, page_size: int = 100) -> list[dict[str, Any]]:
         """Retrieve the content blocks of a Notion page.
@@ -59,16 +64,17 @@ class NotionPageExtractor:
             list: List of block objects.
         """
         blocks = []
-        url = f"{self.base_url}/blocks/{page_id}/children?page_size={page_size}"
-        while url:
-            response = requests.get(url, headers=self.headers, timeout=60)
+        url = f"{self.base_url}/blocks/{page_id}/children"
+        params: dict[str, str | int] = {"page_size": page_size}
+        while True:
+            response = self.session.get(url, params=params, timeout=60)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             blocks.extend(data.get("results", []))
-            url = data.get("next_cursor")
-            if url:
-                url = f"{self.base_url}/blocks/{page_id}/children?start_cursor={url}&page_size={page_size}"
-        return blocks
+            next_cursor = data.get("next_cursor")
+            if not next_cursor:
+                return blocks
+            params["start_cursor"] = next_cursor
 
     def query_database(self, database_id: str) -> list[str]:
         """Query a database to retrieve its pages (items).
@@ -89,9 +95,9 @@ class NotionPageExtractor:
             if start_cursor:
                 payload["start_cursor"] = start_cursor
 
-            response = requests.post(url, headers=self.headers, json=payload, timeout=60)
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=60)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             results.extend(data.get("results", []))
             has_more = data.get("has_more", False)
             start_cursor = data.get("next_cursor")
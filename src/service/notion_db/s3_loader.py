@@ -1,13 +1,32 @@
 """Provide a class for uploading images to S3."""
 
+import functools
 import mimetypes
 import urllib.parse
+from pathlib import Path
 
 import boto3
 from botocore.config import Config
 
 from src.settings import settings
 
+# Fallback for common images if mimetypes fails
+FALLBACK_CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+
+
+@functools.lru_cache(maxsize=64)
+def guess_content_type(suffix: str) -> str | None:
+    """Guess the content type of a file from its extension.
+
+    Args:
+        suffix (str): The lower-cased file extension, including the leading dot.
+
+    Returns:
+        str | None: The content type, None if it is unknown.
+    """
+    content_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return content_type or FALLBACK_CONTENT_TYPES.get(suffix)
+
 
 class S3Uploader:
     """Handle uploading files to an S3-compatible storage.
@@ -27,9 +46,19 @@ class S3Uploader:
         endpoint_url = settings.endpoint_url
         self.bucket = settings.s3_bucket
         self.folder = folder
+        # The bucket and endpoint never change, so public URLs only differ by their key
+        self._public_url_prefix = f"https://{self.bucket}.{settings.endpoint_url.removeprefix('https://')}:443/"
+        # Public URLs of the files already uploaded by this instance, keyed by their unchanged local version
+        self._url_cache: dict[tuple[str, str, float], str] = {}
 
         session = boto3.session.Session()  # type: ignore
-        config = Config(request_checksum_calculation="when_required")
+        # Connections are kept alive between the figure uploads of a paper, which run on a few threads and
+        # stay well below the default pool size of 10
+        config = Config(
+            request_checksum_calculation="when_required",
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
+        )
         self.s3_client = session.client(
             service_name="s3",
             aws_access_key_id=aws_access_key_id,
@@ -50,13 +79,13 @@ class S3Uploader:
         Returns:
             str: Public URL of the file.
         """
-        endpoint_url = settings.endpoint_url.removeprefix("https://")
-        encoded_key = urllib.parse.quote(s3_key, safe="/")
-        return f"https://{self.bucket}.{endpoint_url}:443/{encoded_key}"
+        return self._public_url_prefix + urllib.parse.quote(s3_key, safe="/")
 
     def upload_file(self, local_path: str, s3_key: str) -> str:
         """Upload a single file to the specified S3 bucket and make it public.
 
+        A file uploaded earlier to the same key is not uploaded again unless it was modified since.
+
         Args:
             local_path (str): Path to the local file.
             s3_key (str): S3 key (path) where the file will be uploaded.
@@ -64,17 +93,16 @@ class S3Uploader:
         Returns:
             str: Public URL of the uploaded file.
         """
+        cache_key = (local_path, s3_key, Path(local_path).stat().st_mtime)
+        if (public_url := self._url_cache.get(cache_key)) is not None:
+            return public_url
+
         s3_key = f"{self.folder}/{s3_key}"
         extra_args = {"ACL": "public-read"}
-        content_type, _ = mimetypes.guess_type(local_path)
-        if not content_type:
-            # Fallback for common images if mimetypes fails
-            if local_path.lower().endswith((".jpg", ".jpeg")):
-                content_type = "image/jpeg"
-            elif local_path.lower().endswith(".png"):
-                content_type = "image/png"
+        content_type = guess_content_type(Path(local_path).suffix.lower())
         if content_type:
             extra_args["ContentType"] = content_type
 
         self.s3_client.upload_file(local_path, self.bucket, s3_key, ExtraArgs=extra_args)
-        return self.get_public_url(s3_key)
+        self._url_cache[cache_key] = self.get_public_url(s3_key)
+        return self._url_cache[cache_key]
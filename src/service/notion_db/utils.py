@@ -1,6 +1,12 @@
 """Utility functions for working with Notion."""
 
 import re
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from src.utils.rate_limiter import RequestRateLimiter
 
 
 def resolve_image_path(url: str) -> str:
@@ -19,3 +25,33 @@ def resolve_image_path(url: str) -> str:
         relative_path = match.group(1)
         return relative_path.lstrip("/")
     return ""
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter spacing out the requests it sends with a shared rate limiter.
+
+    Pacing requests below the API rate limit avoids paying for 429 responses and their retry backoff.
+    """
+
+    def __init__(self, rate_limiter: RequestRateLimiter, **kwargs: Any) -> None:
+        """Initialize the adapter.
+
+        Args:
+            rate_limiter (RequestRateLimiter): The limiter every request waits on before being sent.
+            **kwargs (Any): Keyword arguments forwarded to `HTTPAdapter`.
+        """
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Wait for the next request slot, then send the request.
+
+        Args:
+            request (PreparedRequest): The request to send.
+            **kwargs (Any): Keyword arguments forwarded to `HTTPAdapter.send`.
+
+        Returns:
+            Response: The response to the request.
+        """
+        self.rate_limiter.wait()
+        return super().send(request, **kwargs)
@@ -9,7 +9,12 @@ This module provides the `PapersProcessor` class, which acts as a central coordi
 - Managing paper lifecycle (insertion, deletion, counting).
 """
 
+import threading
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 
 from loguru import logger
 from qdrant_client import models as qmodels
@@ -20,18 +25,117 @@ from src.service.vector_db.vector_storage import QdrantVectorStore
 from src.utils.schemas import Paper
 
 
+@lru_cache(maxsize=4096)
+def _date_to_ts(date_str: str) -> int:
+    """Return the local timestamp of the start of a YYYY-MM-DD day."""
+    return int(datetime.combine(date.fromisoformat(date_str), datetime.min.time()).timestamp())
+
+
+@lru_cache(maxsize=4096)
+def _end_date_to_ts(date_str: str) -> int:
+    """Return the local timestamp of the last second of a YYYY-MM-DD day."""
+    end_dt = datetime.combine(date.fromisoformat(date_str), datetime.min.time())
+    return int((end_dt + timedelta(days=1) - timedelta(seconds=1)).timestamp())
+
+
+def _date_range_filter(start_date_str: str | None, end_date_str: str | None) -> qmodels.Filter | None:
+    """Build a filter keeping papers published between two YYYY-MM-DD days, both included.
+
+    Args:
+        start_date_str (str | None): The first day of the range, unbounded when None.
+        end_date_str (str | None): The last day of the range, unbounded when None.
+
+    Returns:
+        qmodels.Filter | None: The filter, or None when neither bound is given.
+    """
+    filter_conditions = []
+    if start_date_str:
+        filter_conditions.append(
+            qmodels.FieldCondition(
+                key="published_date_ts",
+                range=qmodels.Range(gte=_date_to_ts(start_date_str)),
+            ),
+        )
+    if end_date_str:
+        # To include the entire end day, filter up to its last second
+        filter_conditions.append(
+            qmodels.FieldCondition(
+                key="published_date_ts",
+                range=qmodels.Range(lt=_end_date_to_ts(end_date_str)),
+            ),
+        )
+    # Only create a Filter object if there are conditions to apply
+    return qmodels.Filter(must=filter_conditions) if filter_conditions else None
+
+
 class PapersProcessor:
     """Papers processor class for processing papers."""
 
-    def __init__(self, vector_store: QdrantVectorStore, embedding_service: EmbeddingService) -> None:
+    # Number of distinct searches whose results are kept until the stored papers change
+    search_cache_size: int = 256
+    # Number of papers kept by id, and of their much larger summary embeddings, until they are stored again
+    paper_cache_size: int = 2048
+    vector_cache_size: int = 128
+
+    def __init__(
+        self,
+        vector_store: QdrantVectorStore,
+        embedding_service: EmbeddingService,
+        arxiv_cache_dir: str | None = None,
+    ) -> None:
         """Initialize the papers processor.
 
         Args:
             vector_store (QdrantVectorStore): The vector store to insert the papers into.
             embedding_service (EmbeddingService): The embedding service to use.
+            arxiv_cache_dir (str | None): Directory caching fetched arXiv papers on disk, disabled when None.
         """
         self.vector_store = vector_store
         self.embedding_service = embedding_service
+        self.arxiv_cache_dir = arxiv_cache_dir
+        # Search results keyed by the normalized query and its filters, least recently used first
+        self._search_cache: OrderedDict[tuple[str, int, float, str | None, str | None], list[Paper]] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        # Papers and their summary embeddings by paper id, least recently used first
+        self._paper_cache: OrderedDict[str, Paper] = OrderedDict()
+        self._vector_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._paper_cache_lock = threading.Lock()
+
+    def _clear_search_cache(self) -> None:
+        """Forget cached search results once papers are added to or removed from the vector store."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+
+    def _cache_papers(self, papers: list[Paper]) -> None:
+        """Remember papers read from the vector store, so they can be returned by id without a request."""
+        with self._paper_cache_lock:
+            for paper in papers:
+                self._paper_cache[paper.paper_id] = paper
+                self._paper_cache.move_to_end(paper.paper_id)
+            while len(self._paper_cache) > self.paper_cache_size:
+                self._paper_cache.popitem(last=False)
+
+    def _forget_papers(self, paper_ids: list[str]) -> None:
+        """Drop cached papers and embeddings once they are overwritten or removed in the vector store."""
+        with self._paper_cache_lock:
+            for paper_id in paper_ids:
+                self._paper_cache.pop(paper_id, None)
+                self._vector_cache.pop(paper_id, None)
+
+    def _get_vector(self, paper_id: str) -> list[float]:
+        """Return the stored summary embedding of a paper, or an empty list when it is not stored."""
+        with self._paper_cache_lock:
+            if (vector := self._vector_cache.get(paper_id)) is not None:
+                self._vector_cache.move_to_end(paper_id)
+                return vector
+
+        vector = self.vector_store.get_vector(paper_id)
+        if vector:
+            with self._paper_cache_lock:
+                self._vector_cache[paper_id] = vector  # type: ignore[assignment]
+                if len(self._vector_cache) > self.vector_cache_size:
+                    self._vector_cache.popitem(last=False)
+        return vector  # type: ignore[return-value]
 
     def insert_papers(self, start_date: date, end_date: date) -> float:
         """Insert the papers into the vector store.
@@ -48,7 +152,7 @@ class PapersProcessor:
 
         embedder_costs = 0.0
         current_embedding_model = self.embedding_service.model_name
-        for papers in fetch_papers_day_by_day(start_date_str, end_date_str):
+        for papers in fetch_papers_day_by_day(start_date_str, end_date_str, cache_dir=self.arxiv_cache_dir):
             paper_ids = [paper.paper_id for paper in papers]
 
             # Pre-check Qdrant: if the point exists and embedding_model matches, skip embedding.
@@ -90,6 +194,8 @@ class PapersProcessor:
                 skip_existing=False,
                 embedding_model=current_embedding_model,
             )
+            self._forget_papers(ids_to_embed)
+            self._clear_search_cache()
         return embedder_costs
 
     def search_papers(
@@ -109,56 +215,90 @@ class PapersProcessor:
             start_date_str (str | None): The start date to search for (YYYY-MM-DD).
             end_date_str (str | None): The end date to search for (YYYY-MM-DD).
         """
-        query_embedding = self.embedding_service.embed_text(query)
+        cache_key = (" ".join(query.lower().split()), k, threshold, start_date_str, end_date_str)
+        with self._search_cache_lock:
+            if (cached_papers := self._search_cache.get(cache_key)) is not None:
+                self._search_cache.move_to_end(cache_key)
+                return list(cached_papers)
+
+        papers = self._search_papers(query, k, threshold, start_date_str, end_date_str)
+        if papers is None:
+            # A failed search is not cached, so the next identical query reaches the vector store again
+            return []
+        with self._search_cache_lock:
+            self._search_cache[cache_key] = papers
+            if len(self._search_cache) > self.search_cache_size:
+                self._search_cache.popitem(last=False)
+        return list(papers)
 
-        # get only papers inside the date range
-        filter_conditions = []
-        start_dt: datetime | None = None
-        end_dt: datetime | None = None
-
-        # Add a lower-bound date condition if a start date is provided
-        if start_date_str:
-            start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")  # noqa: DTZ007
-            start_timestamp = start_dt.timestamp()
-            filter_conditions.append(
-                qmodels.FieldCondition(
-                    key="published_date_ts",
-                    range=qmodels.Range(gte=start_timestamp),
-                ),
-            )
+    def _search_papers(
+        self,
+        query: str,
+        k: int,
+        threshold: float,
+        start_date_str: str | None,
+        end_date_str: str | None,
+    ) -> list[Paper] | None:
+        """Search the papers in the vector store, bypassing the search cache.
 
-        if end_date_str:
-            end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")  # noqa: DTZ007
-            # To include the entire end day, filter for less than the start of the next day
-            next_day_dt = end_dt + timedelta(days=1) - timedelta(seconds=1)
-            next_day_timestamp = next_day_dt.timestamp()
-            filter_conditions.append(
-                qmodels.FieldCondition(
-                    key="published_date_ts",
-                    range=qmodels.Range(lt=next_day_timestamp),  # Use 'lt' (less than)
-                ),
-            )
+        Args:
+            query (str): The query to search for.
+            k (int): The number of papers to return per each day.
+            threshold (float): The threshold for the similarity score.
+            start_date_str (str | None): The start date to search for (YYYY-MM-DD).
+            end_date_str (str | None): The end date to search for (YYYY-MM-DD).
 
-        # Calculate total k based on date range (k is per day)
-        if start_dt and end_dt:
-            num_days = max(1, (end_dt - start_dt).days + 1)
-            total_k = k * num_days
-        else:
-            total_k = k
+        Returns:
+            list[Paper] | None: The papers found, or None if the vector store search failed.
+        """
+        query_embedding = self.embedding_service.embed_text(query)
 
-        # Only create a Filter object if there are conditions to apply
-        final_filter = qmodels.Filter(must=filter_conditions) if filter_conditions else None
+        # k is per day, so a date range is searched one day at a time, with all days sent in a single request
+        if start_date_str and end_date_str:
+            start_day = date.fromisoformat(start_date_str)
+            num_days = (date.fromisoformat(end_date_str) - start_day).days + 1
+            day_strs = [(start_day + timedelta(days=offset)).isoformat() for offset in range(num_days)]
+            day_filters = [_date_range_filter(day_str, day_str) for day_str in day_strs]
+            try:
+                results_per_day = self.vector_store.search_batch(
+                    query_embedding,
+                    k,
+                    threshold,
+                    day_filters,
+                    raise_errors=True,
+                )
+            except Exception:
+                # The vector store already logged the error
+                return None
+            results = sorted(chain.from_iterable(results_per_day), key=attrgetter("score"), reverse=True)
+        else:
+            try:
+                results = self.vector_store.search(
+                    query_embedding,
+                    k,
+                    threshold,
+                    _date_range_filter(start_date_str, end_date_str),
+                    raise_errors=True,
+                )
+            except Exception:
+                return None
 
-        results = self.vector_store.search(query_embedding, total_k, threshold, final_filter)
-        if results:
-            return [Paper(**result.payload) for result in results]  # type: ignore
-        return []
+        papers = [Paper(**result.payload) for result in results]  # type: ignore
+        self._cache_papers(papers)
+        return papers
 
     def get_paper_by_id(self, paper_id: str) -> Paper | None:
         """Retrieves a single paper from the vector store by its unique ID."""
+        with self._paper_cache_lock:
+            if (paper := self._paper_cache.get(paper_id)) is not None:
+                self._paper_cache.move_to_end(paper_id)
+                return paper
+
         results = self.vector_store.retrieve([paper_id])
         if results:
-            return Paper(**results[0].payload)  # type: ignore[missing-argument]
+            paper = Paper(**results[0].payload)  # type: ignore[missing-argument]
+            self._cache_papers([paper])
+            return paper
         return None
 
     def fetch_and_store_paper(self, paper_id: str, arxiv_fetcher: ArxivFetcher) -> Paper | None:
@@ -200,6 +340,8 @@ class PapersProcessor:
             skip_existing=False,
             embedding_model=self.embedding_service.model_name,
         )
+        self._forget_papers([paper.paper_id])
+        self._clear_search_cache()
         return paper
 
     def find_similar_papers(
@@ -219,36 +361,14 @@ class PapersProcessor:
             start_date_str (str | None): The start date to search for (YYYY-MM-DD).
             end_date_str (str | None): The end date to search for (YYYY-MM-DD).
         """
-        source_vector = self.vector_store.get_vector(paper_id)
+        source_vector = self._get_vector(paper_id)
         if not source_vector:
             return []
 
-        # Date filtering logic similar to search_papers
-        must_conditions = []
-        if start_date_str:
-            start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")  # noqa: DTZ007
-            start_timestamp = start_dt.timestamp()
-            must_conditions.append(
-                qmodels.FieldCondition(
-                    key="published_date_ts",
-                    range=qmodels.Range(gte=start_timestamp),
-                ),
-            )
-
-        if end_date_str:
-            end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")  # noqa: DTZ007
-            next_day_dt = end_dt + timedelta(days=1) - timedelta(seconds=1)
-            next_day_timestamp = next_day_dt.timestamp()
-            must_conditions.append(
-                qmodels.FieldCondition(
-                    key="published_date_ts",
-                    range=qmodels.Range(lt=next_day_timestamp),
-                ),
-            )
-
         # Combine date filters with exclusion of the source paper
+        date_filter = _date_range_filter(start_date_str, end_date_str)
         search_filter = qmodels.Filter(
-            must=must_conditions if must_conditions else None,
+            must=date_filter.must if date_filter is not None else None,
             must_not=[
                 qmodels.FieldCondition(key="paper_id", match=qmodels.MatchValue(value=paper_id)),
             ],
@@ -260,15 +380,17 @@ class PapersProcessor:
             threshold=threshold,
             q_filter=search_filter,
         )
-        if results:
-            return [Paper(**result.payload) for result in results]  # type: ignore
-        return []
+        papers = [Paper(**result.payload) for result in results]  # type: ignore
+        self._cache_papers(papers)
+        return papers
 
     def delete_papers(self, paper_ids: list[str]) -> None:
         """Deletes one or more papers from the vector store."""
         if not paper_ids:
             return
         self.vector_store.delete(paper_ids)
+        self._forget_papers(paper_ids)
+        self._clear_search_cache()
 
     def count_papers(self) -> int:
         """Returns the total number of papers in the vector store."""
@@ -2,9 +2,12 @@
 
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from google import genai
-from google.genai.types import EmbedContentResponse
+from google.genai.types import EmbedContentResponse, HttpOptions, HttpRetryOptions
 from loguru import logger
 
 MODEL_PRICE: dict[str, float] = {
@@ -18,18 +21,41 @@ class EmbeddingService:
 
     location: str = "us-central1"  # Using us-central1 as default location
 
-    def __init__(self, model_name: str = "gemini-embedding-001", batch_size: int = 250) -> None:
+    # Rate-limited and transiently failing requests are retried with jittered exponential backoff
+    request_attempts: int = 5
+    # Number of single-text embeddings remembered, a 3072-dimensional vector takes about 100 KB
+    text_cache_size: int = 128
+
+    def __init__(
+        self,
+        model_name: str = "gemini-embedding-001",
+        batch_size: int = 250,
+        max_concurrency: int = 4,
+    ) -> None:
         """Initialize the embedding service.
 
         Args:
             model_name (str): The name of the model to use for embedding.
             batch_size (int): The batch size to use for embedding.
+            max_concurrency (int): Maximum number of batches embedded at the same time.
         """
         self.batch_size = batch_size
         self.model_name = model_name
         self._load_project_id_from_creds()
         # Initialize the gemini client
-        self.client = genai.Client(vertexai=True, location=self.location, project=self.project)
+        self.client = genai.Client(
+            vertexai=True,
+            location=self.location,
+            project=self.project,
+            http_options=HttpOptions(retry_options=HttpRetryOptions(attempts=self.request_attempts)),
+        )
+        self._batch_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="embed-batch")
+        # Batches finish on several threads, so the price counters are updated under a lock
+        self._price_lock = threading.Lock()
+        # Embeddings of recently embedded single texts, least recently used first. The model is fixed
+        # for the lifetime of the service, so the text alone is the key
+        self._text_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._text_cache_lock = threading.Lock()
         logger.info(f"Initialized embedding service with model {model_name}")
         self.price_per_million_tokens = MODEL_PRICE[model_name]
         self.inference_price = 0.0
@@ -64,18 +90,54 @@ class EmbeddingService:
     def embed_text(self, text: str) -> list[float]:
         """Embed a single text.
 
+        Recently embedded texts are served from an in-memory cache, without a request or its price.
+
         Args:
             text (str): The text to embed.
 
         Returns:
             list[float]: The embedding vector as a Python list of floats.
         """
+        with self._text_cache_lock:
+            if (cached_embedding := self._text_cache.get(text)) is not None:
+                self._text_cache.move_to_end(text)
+                return list(cached_embedding)
+
         response = self.client.models.embed_content(model=self.model_name, contents=text)
-        self.inference_price = self.calculate_inference_price(response)
-        self.total_inference_price += self.inference_price
+        self._add_inference_price(self.calculate_inference_price(response))
+        if not response.embeddings:
+            return []
+        embedding = response.embeddings[0].values
+        with self._text_cache_lock:
+            self._text_cache[text] = list(embedding)
+            if len(self._text_cache) > self.text_cache_size:
+                self._text_cache.popitem(last=False)
+        return embedding
+
+    def _add_inference_price(self, price: float) -> None:
+        """Record the price of a finished embedding request.
+
+        Args:
+            price (float): The price of the request.
+        """
+        with self._price_lock:
+            self.inference_price = price
+            self.total_inference_price += price
+
+    def _embed_contents(self, batch: list[str]) -> list[list[float]]:
+        """Embed one batch of texts with a single request.
+
+        Args:
+            batch (list[str]): The texts to embed, at most `batch_size` of them.
+
+        Returns:
+            list[list[float]]: The embedding vectors of the batch.
+        """
+        response = self.client.models.embed_content(model=self.model_name, contents=batch)
+        self._add_inference_price(self.calculate_inference_price(response))
         if not response.embeddings:
             return []
-        return response.embeddings[0].values
+        return [embedding.values for embedding in response.embeddings]
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Embed a batch of texts.
@@ -86,15 +148,10 @@ class EmbeddingService:
         Returns:
             list[list[float]]: The embedding vectors as a list of list of floats.
         """
-        all_embeddings = []
-
-        # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            response = self.client.models.embed_content(model=self.model_name, contents=batch)
-            self.inference_price = self.calculate_inference_price(response)
-            self.total_inference_price += self.inference_price
-            if response.embeddings:
-                all_embeddings.extend(embedding.values for embedding in response.embeddings)
-
-        return all_embeddings
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        # Batches are embedded concurrently, `map` yields their results in input order
+        return [
+            embedding
+            for embeddings in self._batch_executor.map(self._embed_contents, batches)
+            for embedding in embeddings
+        ]
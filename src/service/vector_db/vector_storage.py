@@ -1,6 +1,7 @@
 """Qdrant vector store wrapper and collection setup."""
 
 import itertools
+import threading
 import uuid
 from collections import defaultdict
 from collections.abc import Iterable
@@ -17,6 +18,9 @@ from src.utils.schemas import Paper, QdrantConnectionConfig
 class QdrantVectorStore:
     """A wrapper around QdrantClient."""
 
+    # Maximum number of searches sent in one batch request
+    max_batch_queries: int = 32
+
     def __init__(
         self,
         collection: str = "arxiv_papers",
@@ -38,6 +42,9 @@ class QdrantVectorStore:
         self.collection = collection
         self.vector_size = vector_size
         self.distance = distance
+        # The date index is checked, and float timestamps migrated, once per store rather than on every request
+        self._date_index_ready = False
+        self._date_index_lock = threading.Lock()
 
         if config is None:
             config = QdrantConnectionConfig()
@@ -87,14 +94,13 @@ class QdrantVectorStore:
                     collection_name=self.collection,
                     vectors_config=qmodels.VectorParams(size=self.vector_size, distance=self.distance),
                 )
+                self._date_index_ready = False
 
-            # Ensure payload index for efficient sorting by date
-            self.client.create_payload_index(
-                collection_name=self.collection,
-                field_name="published_date_ts",
-                field_schema=qmodels.PayloadSchemaType.FLOAT,
-                wait=True,
-            )
+            if not self._date_index_ready:
+                with self._date_index_lock:
+                    if not self._date_index_ready:
+                        self._ensure_date_index()
+                        self._date_index_ready = True
         except UnexpectedResponse as exp:
             logger.error(f"An API error occurred while ensuring collection '{self.collection}': {exp}")
             raise
@@ -102,6 +108,60 @@ class QdrantVectorStore:
             logger.error(f"An unexpected error occurred: {exp}")
             raise
 
+    def _ensure_date_index(self) -> None:
+        """Index 'published_date_ts' as an integer for sorting and range filtering by date.
+
+        Until the integer index exists, float timestamps stored by earlier versions are rewritten as integers
+        first, since the integer index skips float values. A former float index is then replaced.
+        """
+        payload_schema = self.client.get_collection(self.collection).payload_schema
+        date_index = payload_schema.get("published_date_ts")
+        if date_index is not None and date_index.data_type == qmodels.PayloadSchemaType.INTEGER:
+            return
+
+        logger.info(f"Migrating 'published_date_ts' of collection '{self.collection}' to integer timestamps.")
+        self._convert_date_timestamps_to_int()
+        if date_index is not None:
+            self.client.delete_payload_index(
+                collection_name=self.collection,
+                field_name="published_date_ts",
+                wait=True,
+            )
+
+        self.client.create_payload_index(
+            collection_name=self.collection,
+            field_name="published_date_ts",
+            field_schema=qmodels.IntegerIndexParams(type=qmodels.IntegerIndexType.INTEGER, range=True, lookup=False),
+            wait=True,
+        )
+
+    def _convert_date_timestamps_to_int(self) -> None:
+        """Rewrite float 'published_date_ts' payloads as integer seconds since the epoch."""
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self.collection,
+                limit=1000,
+                with_payload=["published_date_ts"],
+                with_vectors=False,
+                offset=offset,
+            )
+            operations = [
+                qmodels.SetPayloadOperation(
+                    set_payload=qmodels.SetPayload(payload={"published_date_ts": int(ts)}, points=[rec.id]),
+                )
+                for rec in records
+                if isinstance(ts := (rec.payload or {}).get("published_date_ts"), float)
+            ]
+            if operations:
+                self.client.batch_update_points(
+                    collection_name=self.collection,
+                    update_operations=operations,
+                    wait=True,
+                )
+            if offset is None:
+                break
+
     def find_start_end_dates(self) -> tuple[str | None, str | None]:
         """Find the start and end dates of the collection efficiently.
 
@@ -279,6 +339,8 @@ class QdrantVectorStore:
         limit: int = 10,
         threshold: float = 0.65,
         q_filter: qmodels.Filter | None = None,
+        *,
+        raise_errors: bool = False,
     ) -> list[qmodels.ScoredPoint]:
         """Searches for similar vectors.
 
@@ -287,6 +349,9 @@ class QdrantVectorStore:
             limit (int): The maximum number of results to return.
             threshold (float): The threshold for the similarity score.
             q_filter (qmodels.Filter | None): A filter to apply to the search.
+            *: keyword only arguments
+            raise_errors (bool): If True, search errors are raised after being logged instead of returning
+                an empty list, so callers can tell a failure from a search without matches.
 
         Returns:
             A list of scored points, or an empty list if an error occurs.
@@ -302,7 +367,58 @@ class QdrantVectorStore:
             )
         except Exception as exp:
             logger.error(f"An error occurred during search: {exp}")
+            if raise_errors:
+                raise
+            return []
+
+    def search_batch(
+        self,
+        query_vector: list[float],
+        limit: int,
+        threshold: float,
+        q_filters: list[qmodels.Filter | None],
+        *,
+        raise_errors: bool = False,
+    ) -> list[list[qmodels.ScoredPoint]]:
+        """Searches for similar vectors under several filters in a single request.
+
+        Args:
+            query_vector (list[float]): The vector to search for.
+            limit (int): The maximum number of results to return for each filter.
+            threshold (float): The threshold for the similarity score.
+            q_filters (list[qmodels.Filter | None]): The filters, each applied to its own search.
+            *: keyword only arguments
+            raise_errors (bool): If True, search errors are raised after being logged instead of returning
+                an empty list.
+
+        Returns:
+            One list of scored points per filter, or an empty list if an error occurs.
+        """
+        if not q_filters:
+            return []
+        self.ensure_collection()
+        requests = [
+            qmodels.QueryRequest(
+                query=query_vector,
+                filter=q_filter,
+                limit=limit,
+                score_threshold=threshold,
+                with_payload=True,
+            )
+            for q_filter in q_filters
+        ]
+        results: list[list[qmodels.ScoredPoint]] = []
+        try:
+            # Long date ranges are split, so one request never carries more than `max_batch_queries` searches
+            for requests_chunk in itertools.batched(requests, self.max_batch_queries):
+                responses = self.client.query_batch_points(collection_name=self.collection, requests=requests_chunk)
+                results.extend(response.points for response in responses)
+        except Exception as exp:
+            logger.error(f"An error occurred during batch search: {exp}")
+            if raise_errors:
+                raise
             return []
+        return results
 
     def retrieve(self, ids: list[str] | str) -> list[qmodels.Record] | qmodels.Record:
         """Retrieve points from the vector store by their IDs.
@@ -117,7 +117,10 @@ class WorkflowService:
                 if category != "AdHoc Research" and category not in existing_categories:
                     page_id = existing_page.get("page_id")
                     if page_id:
-                        self.notion_uploader.add_category_to_page(page_id, category)
+                        # Categories served from the page cache may miss recent Notion edits, which the
+                        # update would overwrite, so they are fetched again before updating
+                        known_categories = None if existing_page.get("cached") else existing_categories
+                        self.notion_uploader.add_category_to_page(page_id, category, known_categories)
                         logger.info(f"Added category '{category}' to existing page for paper {paper_id}")
                 return cached_result.notion_page_url
             logger.info(f"No existing page found for paper {paper_id}. Proceeding to fetch and summarize.")
@@ -48,6 +48,10 @@ class Settings(BaseSettings):
     summarizer_thinking_level: str = Field("MEDIUM", description="Thinking level for the summarizer LLM.")
     summarizer_path_to_prompt: str = Field("prompts/summarizer.txt", description="Path to the summarizer prompt.")
     tmp_storage_dir: str = Field("storage/tmp_storage", description="Path to the temporary storage directory.")
+    arxiv_cache_dir: str | None = Field(
+        "storage/arxiv_cache",
+        description="Directory caching fetched arXiv papers per query window; caching is disabled when unset.",
+    )
     telegram_token: str = Field(..., description="Telegram bot token.")
     telegram_chat_id: int = Field(..., description="Chat ID to send notifications to.")
     scheduler_timezone: str = Field("Europe/Moscow", description="Timezone for scheduler cron jobs")
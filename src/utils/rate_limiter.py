@@ -0,0 +1,47 @@
+"""Rate limiting shared by the clients of external APIs."""
+
+import asyncio
+import threading
+import time
+
+
+class RequestRateLimiter:
+    """Space out requests so that at most one of them starts every `min_interval` seconds.
+
+    Request slots are reserved under a lock, so one limiter can be shared by threads and by the tasks
+    of an event loop. Time spent between two requests, e.g. parsing a page, counts towards the interval.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            min_interval (float): Minimum number of seconds between the start of two requests.
+        """
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the next request slot.
+
+        Returns:
+            float: Number of seconds to wait before the reserved slot starts.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until the next request slot."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_turn(self) -> None:
+        """Sleep without blocking the event loop until the next request slot."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -24,7 +24,7 @@ class Paper(BaseModel):
     authors: list[str]
     summary: str
     published_date: str
-    published_date_ts: float
+    published_date_ts: int
     updated_date: str
     updated_date_ts: float
     pdf_url: str
@@ -1,9 +1,14 @@
 """Unit tests for markdown to Notion conversion with equation parsing."""
 # ruff: noqa: S101, SLF001, PLR2004
 
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
+from requests import Response
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
 
 from src.service.notion_db.add_content_to_page import MarkdownToNotionUploader
 
@@ -183,6 +188,291 @@ class TestMarkdownToBlocksEquations:
         assert len(equation_items) == 1
 
 
+class TestMarkdownToBlocksStructure:
+    """Tests for meta lines, headings and list items in markdown_to_blocks."""
+
+    def test_block_types(self, uploader: MarkdownToNotionUploader) -> None:
+        """Skip the meta block and blank lines, and map headings and bullets to their block types."""
+        markdown = "---\nlayout: post\n---\n## Test Title\n\n# Part\n### Detail\n\n- First\n* Second\nText"
+        blocks, _, _, title, _ = uploader.markdown_to_blocks(markdown)
+
+        assert title == "Test Title"
+        assert [block["type"] for block in blocks] == [
+            "heading_1",
+            "heading_3",
+            "bulleted_list_item",
+            "bulleted_list_item",
+            "paragraph",
+        ]
+        assert blocks[1]["heading_3"]["rich_text"][0]["text"]["content"] == "Detail"
+
+    def test_unsupported_headings_are_paragraphs(self, uploader: MarkdownToNotionUploader) -> None:
+        """Keep deeper headings and markers without a space as paragraph text."""
+        blocks, _, _, _, _ = uploader.markdown_to_blocks("#### Deep\n\n#hashtag\n\n### Section")
+
+        assert [block["type"] for block in blocks] == ["paragraph", "paragraph", "heading_3"]
+        assert blocks[2]["heading_3"]["rich_text"][0]["text"]["content"] == "Section"
+
+    def test_horizontal_rules_keep_body(self, uploader: MarkdownToNotionUploader) -> None:
+        """Only treat the leading "---" block as front matter, not the text between two rules."""
+        markdown = "---\ntitle: paper\n---\n## Test Title\nBefore\n---\nBetween\n---\nAfter"
+        blocks, _, _, _, _ = uploader.markdown_to_blocks(markdown)
+
+        assert [block["paragraph"]["rich_text"][0]["text"]["content"] for block in blocks] == [
+            "Before",
+            "Between",
+            "After",
+        ]
+
+    def test_consecutive_lines_share_paragraph(self, uploader: MarkdownToNotionUploader) -> None:
+        """Merge consecutive prose lines into one paragraph and start a new one after a blank line."""
+        markdown = "## Test Title\nFirst line\nSecond **bold** line\n\nNext paragraph"
+        blocks, _, _, _, _ = uploader.markdown_to_blocks(markdown)
+
+        assert len(blocks) == 2
+        assert [segment["text"]["content"] for segment in blocks[0]["paragraph"]["rich_text"]] == [
+            "First line",
+            "\n",
+            "Second ",
+            "bold",
+            " line",
+        ]
+        assert blocks[1]["paragraph"]["rich_text"] == [{"type": "text", "text": {"content": "Next paragraph"}}]
+
+    def test_long_paragraph_is_split(self, uploader: MarkdownToNotionUploader) -> None:
+        """Start a new paragraph before exceeding Notion's rich text limit per block."""
+        blocks, _, _, _, _ = uploader.markdown_to_blocks("\n".join(f"Line {idx}" for idx in range(60)))
+
+        assert [len(block["paragraph"]["rich_text"]) for block in blocks] == [99, 19]
+
+    def test_meta_lines(self, uploader: MarkdownToNotionUploader) -> None:
+        """Read the arXiv URL, published date and authors list from their meta lines."""
+        markdown = (
+            "## Test Title\n**ArXiv URL:** https://arxiv.org/abs/2601.02242\n"
+            "**Published Date:** 2026-01-05\n**Authors:**['Ann Lee', \"Sean O'Brien\"]"
+        )
+        blocks, arxiv_url, published_date, _, authors = uploader.markdown_to_blocks(markdown)
+
+        assert blocks == []
+        assert arxiv_url == "https://arxiv.org/abs/2601.02242"
+        assert published_date == "2026-01-05"
+        assert authors == ["Ann Lee", "Sean O'Brien"]
+
+    def test_meta_lines_in_body_are_paragraphs(self, uploader: MarkdownToNotionUploader) -> None:
+        """Keep meta-like bold lines after the first content block as regular text."""
+        markdown = "## Test Title\n**ArXiv URL:** 2601.02242\nIntro\n\n**ArXiv URL:** 2601.00001"
+        blocks, arxiv_url, _, _, _ = uploader.markdown_to_blocks(markdown)
+
+        assert arxiv_url == "2601.02242"
+        assert [block["type"] for block in blocks] == ["paragraph", "paragraph"]
+
+    def test_authors_are_not_executed(self, uploader: MarkdownToNotionUploader) -> None:
+        """Reject an authors line that is not a literal instead of evaluating it."""
+        _, _, _, _, authors = uploader.markdown_to_blocks("**Authors:**__import__('os').getcwd()")
+
+        assert authors == []
+
+
+# =============================================================================
+# Page Upload Tests (upload_markdown_file)
+# =============================================================================
+
+
+class TestUploadMarkdownFile:
+    """Tests for creating Notion pages from markdown files."""
+
+    def test_images_are_uploaded_in_background(self, uploader: MarkdownToNotionUploader) -> None:
+        """Fill image blocks with the public URL returned by the S3 upload."""
+        uploader.bucket.upload_file.return_value = "https://bucket/figures/figure_1.png"
+
+        markdown = "## Test Title\n\n![Figure]({{ '/figures/figure_1.png' | relative_url }})"
+        blocks, _, _, _, _ = uploader.markdown_to_blocks(markdown)
+
+        assert blocks[0]["image"]["external"] == {"url": "https://bucket/figures/figure_1.png"}
+        uploader.bucket.upload_file.assert_called_once_with("figures/figure_1.png", "figures/figure_1.png")
+
+    def test_appends_blocks_beyond_request_limit(self, uploader: MarkdownToNotionUploader, tmp_path: Path) -> None:
+        """Create the page with the first blocks and append the rest in batches."""
+        markdown_path = tmp_path / "paper.md"
+        markdown_path.write_text("## Test Title\n" + "\n\n".join(f"Paragraph {idx}" for idx in range(250)))
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"id": "page-id", "url": "https://notion.so/page"})
+
+        page_url = uploader.upload_markdown_file(str(markdown_path))
+
+        assert page_url == "https://notion.so/page"
+        assert len(orjson.loads(uploader.session.post.call_args.kwargs["data"])["children"]) == 100
+        appended = [orjson.loads(call.kwargs["data"])["children"] for call in uploader.session.patch.call_args_list]
+        assert [len(children) for children in appended] == [100, 50]
+        assert appended[-1][-1]["paragraph"]["rich_text"][0]["text"]["content"] == "Paragraph 249"
+        assert uploader.session.patch.call_args.args[0].endswith("/blocks/page-id/children")
+
+    def test_session_retries_rate_limited_requests(self, uploader: MarkdownToNotionUploader) -> None:
+        """Retry only the statuses Notion returns before applying a request."""
+        retries = uploader.session.get_adapter("https://api.notion.com/v1").max_retries
+
+        assert retries.is_retry("POST", 429)
+        assert retries.is_retry("PATCH", 503)
+        assert not retries.is_retry("POST", 500)
+
+    def test_session_does_not_replay_timed_out_writes(self, uploader: MarkdownToNotionUploader) -> None:
+        """Give up on a request whose response timed out, it may already have been applied."""
+        retries = uploader.session.get_adapter("https://api.notion.com/v1").max_retries
+
+        with pytest.raises(MaxRetryError):
+            retries.increment("POST", "/v1/pages", error=ReadTimeoutError(None, "/v1/pages", "Read timed out."))
+
+    def test_session_paces_requests(self, uploader: MarkdownToNotionUploader) -> None:
+        """Wait for the rate limiter before every request sent to Notion."""
+        adapter = uploader.session.get_adapter("https://api.notion.com/v1")
+        adapter.rate_limiter = MagicMock()
+
+        response = Response()
+        response.status_code = 200
+
+        with patch("requests.adapters.HTTPAdapter.send", return_value=response) as send:
+            uploader.session.get("https://api.notion.com/v1/pages/page-id", timeout=30)
+
+        adapter.rate_limiter.wait.assert_called_once()
+        send.assert_called_once()
+
+
+# =============================================================================
+# Page Lookup Tests (find_paper_pages_bulk)
+# =============================================================================
+
+
+class TestFindPaperPagesBulk:
+    """Tests for looking up several paper pages at once."""
+
+    @staticmethod
+    def _page(arxiv_id: str) -> dict:
+        return {
+            "url": f"https://notion.so/{arxiv_id}",
+            "properties": {"Arxiv": {"url": f"https://www.alphaxiv.org/abs/{arxiv_id}"}},
+        }
+
+    def test_queries_chunks_of_urls(self, uploader: MarkdownToNotionUploader) -> None:
+        """Send one OR query per chunk and map every input to its page URL."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page("2601.00001")]})
+        arxiv_ids = [f"2601.{idx:05d}" for idx in range(1, 151)]
+
+        page_urls = uploader.find_paper_pages_bulk(arxiv_ids)
+
+        assert page_urls["2601.00001"] == "https://notion.so/2601.00001"
+        assert page_urls["2601.00002"] is None
+        assert len(page_urls) == 150
+        filters = [orjson.loads(call.kwargs["data"])["filter"]["or"] for call in uploader.session.post.call_args_list]
+        assert [len(conditions) for conditions in filters] == [100, 50]
+
+    def test_single_lookup_uses_bulk_query(self, uploader: MarkdownToNotionUploader) -> None:
+        """Keep the single URL lookup working through the bulk query."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page("2601.02242")]})
+
+        assert uploader.find_paper_page_url("2601.02242", category="Agents") == "https://notion.so/2601.02242"
+        conditions = orjson.loads(uploader.session.post.call_args.kwargs["data"])["filter"]["and"]
+        assert conditions[1] == {"property": "Category", "multi_select": {"contains": "Agents"}}
+
+    def test_request_error_returns_none(self, uploader: MarkdownToNotionUploader) -> None:
+        """Report every paper as missing when the query fails."""
+        uploader.session = MagicMock()
+        uploader.session.post.side_effect = ConnectionError
+
+        assert uploader.find_paper_pages_bulk(["2601.02242"]) == {"2601.02242": None}
+
+
+class TestFindPaperPageCache:
+    """Tests for remembering found paper pages."""
+
+    @staticmethod
+    def _page(categories: list[str]) -> dict:
+        return {
+            "id": "page-id",
+            "url": "https://notion.so/page",
+            "properties": {"Category": {"type": "multi_select", "multi_select": [{"name": c} for c in categories]}},
+        }
+
+    def test_found_page_is_cached(self, uploader: MarkdownToNotionUploader) -> None:
+        """Query Notion once for a page found earlier."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page(["Agents"])]})
+
+        first = uploader.find_paper_page("2601.02242")
+        second = uploader.find_paper_page("https://www.alphaxiv.org/abs/2601.02242")
+
+        page = {"page_id": "page-id", "page_url": "https://notion.so/page", "categories": ["Agents"]}
+        assert first == page | {"cached": False}
+        assert second == page | {"cached": True}
+        uploader.session.post.assert_called_once()
+
+    def test_expired_page_is_queried_again(
+        self,
+        uploader: MarkdownToNotionUploader,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Query Notion again once a cached page is older than the cache TTL."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page(["Agents"])]})
+        monkeypatch.setattr(uploader, "paper_page_cache_ttl", 0.0)
+
+        uploader.find_paper_page("2601.02242")
+        uploader.find_paper_page("2601.02242")
+
+        assert uploader.session.post.call_count == 2
+
+    def test_cache_is_safe_across_threads(
+        self,
+        uploader: MarkdownToNotionUploader,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Expire, evict and refill cached pages from several threads without errors."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page(["Agents"])]})
+        monkeypatch.setattr(uploader, "paper_page_cache_ttl", 0.0)
+        monkeypatch.setattr(uploader, "paper_page_cache_size", 2)
+        arxiv_ids = [f"2601.0000{index % 4}" for index in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pages = list(executor.map(uploader.find_paper_page, arxiv_ids))
+
+        assert all(page is not None and page["page_id"] == "page-id" for page in pages)
+
+    def test_missing_page_is_not_cached(self, uploader: MarkdownToNotionUploader) -> None:
+        """Query Notion again for a page that was not found."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": []})
+
+        assert uploader.find_paper_page("2601.02242") is None
+        assert uploader.find_paper_page("2601.02242") is None
+        assert uploader.session.post.call_count == 2
+
+    def test_added_category_updates_cache(self, uploader: MarkdownToNotionUploader) -> None:
+        """Reflect a category added to a cached page without querying Notion again."""
+        uploader.session = MagicMock()
+        uploader.session.post.return_value.content = orjson.dumps({"results": [self._page(["Agents"])]})
+        uploader.session.get.return_value.content = orjson.dumps(self._page(["Agents"]))
+        uploader.find_paper_page("2601.02242")
+
+        assert uploader.add_category_to_page("page-id", "Robotics")
+
+        assert uploader.find_paper_page("2601.02242")["categories"] == ["Agents", "Robotics"]
+        uploader.session.post.assert_called_once()
+
+    def test_known_categories_skip_page_fetch(self, uploader: MarkdownToNotionUploader) -> None:
+        """Update the page in a single request when its categories are already known."""
+        uploader.session = MagicMock()
+        existing_categories = ["Agents"]
+
+        assert uploader.add_category_to_page("page-id", "Robotics", existing_categories)
+
+        uploader.session.get.assert_not_called()
+        payload = orjson.loads(uploader.session.patch.call_args.kwargs["data"])
+        assert payload["properties"]["Category"]["multi_select"] == [{"name": "Agents"}, {"name": "Robotics"}]
+        assert existing_categories == ["Agents"]
+
+
 # =============================================================================
 # Edge Cases
 # =============================================================================
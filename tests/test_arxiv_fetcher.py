@@ -0,0 +1,307 @@
+"""Tests for the arXiv fetcher."""
+# ruff: noqa: S101
+
+import asyncio
+import functools
+from datetime import UTC, datetime
+from pathlib import Path
+from urllib import parse
+
+import httpx
+import pytest
+
+from src.service.arxiv import arxiv_fetcher
+from src.service.arxiv.arxiv_fetcher import ArxivFetcher, fetch_papers_day_by_day
+from src.service.arxiv.arxiv_utils import (
+    extract_arxiv_id,
+    iter_daily_ranges_excluding,
+    iter_merged_ranges,
+)
+from src.utils.schemas import Paper
+
+ATOM_ENTRY = """
+<entry>
+    <id>http://arxiv.org/abs/{paper_id}v2</id>
+    <updated>2025-06-16T10:00:00Z</updated>
+    <published>2025-06-15T08:30:00Z</published>
+    <title>A Title
+ Spanning Lines</title>
+    <summary>  A summary
+ spanning lines.  </summary>
+    {authors}
+    <link href="http://arxiv.org/abs/{paper_id}v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/{paper_id}v2" rel="related" type="application/pdf"/>
+    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>
+</entry>
+"""
+
+
+def build_feed(paper_ids: list[str], num_authors: int = 2) -> str:
+    """Build an Atom feed with one entry per paper id."""
+    authors = "".join(f"<author><name>Author {idx}</name></author>" for idx in range(num_authors))
+    entries = "".join(ATOM_ENTRY.format(paper_id=paper_id, authors=authors) for paper_id in paper_ids)
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+
+
+async def collect_periods(
+    fetcher: ArxivFetcher,
+    periods: list[tuple[datetime, datetime]],
+) -> list[list[Paper]]:
+    """Collect the papers of every period fetched concurrently."""
+    return [papers async for papers in fetcher.aiter_papers_for_periods(periods, ["cs.CV"])]
+
+
+@pytest.fixture
+def fetcher(monkeypatch: pytest.MonkeyPatch) -> ArxivFetcher:
+    """Create an ArxivFetcher that does not wait between requests."""
+    monkeypatch.setattr(ArxivFetcher, "min_request_interval", 0.0)
+    return ArxivFetcher(page_size=2)
+
+
+class TestParsePapersInfo:
+    """Tests for ArxivFetcher.parse_papers_info."""
+
+    def test_parses_entry_fields(self, fetcher: ArxivFetcher) -> None:
+        """Parse all paper fields from an Atom entry."""
+        papers = fetcher.parse_papers_info(build_feed(["2506.01234"]).encode())
+
+        assert len(papers) == 1
+        paper = papers[0]
+        assert paper.paper_id == "2506.01234"
+        assert paper.title == "A Title Spanning Lines"
+        assert paper.summary == "A summary spanning lines."
+        assert paper.authors == ["Author 0", "Author 1"]
+        assert paper.published_date == "2025-06-15T08:30:00Z"
+        assert paper.published_date_ts == datetime(2025, 6, 15, 8, 30, tzinfo=UTC).timestamp()
+        assert paper.updated_date_ts == datetime(2025, 6, 16, 10, tzinfo=UTC).timestamp()
+        assert paper.pdf_url == "https://arxiv.org/pdf/2506.01234.pdf"
+        assert paper.primary_category == "cs.CV"
+        assert Paper.model_validate(paper.model_dump()) == paper
+
+    def test_parses_feed_in_chunks(self, fetcher: ArxivFetcher) -> None:
+        """Parse a feed delivered in arbitrary chunks like a whole one."""
+        feed = build_feed(["2506.00001", "2506.00002", "2506.00003"]).encode()
+        chunks = [feed[idx : idx + 100] for idx in range(0, len(feed), 100)]
+
+        assert fetcher.parse_papers_info(chunks) == fetcher.parse_papers_info(feed)
+
+    def test_truncates_long_author_lists(self, fetcher: ArxivFetcher) -> None:
+        """Keep the first authors and the last author when there are too many."""
+        paper = fetcher.parse_papers_info(build_feed(["2506.01234"], num_authors=15).encode())[0]
+
+        assert len(paper.authors) == fetcher.max_display_authors
+        assert paper.authors[:2] == ["Author 0", "Author 1"]
+        assert paper.authors[-1] == "Author 14"
+
+
+class TestConcurrentFetching:
+    """Tests for fetching several periods concurrently."""
+
+    def test_pages_through_each_period_in_order(
+        self,
+        fetcher: ArxivFetcher,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Return the papers of every period, following pagination."""
+        pages = {
+            ("20250615000000", "0"): ["2506.00001", "2506.00002"],
+            ("20250615000000", "2"): ["2506.00003"],
+            ("20250616000000", "0"): ["2506.00004"],
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = parse.parse_qs(request.url.query.decode())
+            day = params["search_query"][0].split("[")[1].split(" ")[0]
+            return httpx.Response(200, text=build_feed(pages[day, params["start"][0]]))
+
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+        periods = [
+            (datetime(2025, 6, 15, tzinfo=UTC), datetime(2025, 6, 15, 23, 59, 59, tzinfo=UTC)),
+            (datetime(2025, 6, 16, tzinfo=UTC), datetime(2025, 6, 16, 23, 59, 59, tzinfo=UTC)),
+        ]
+
+        papers_by_period = asyncio.run(collect_periods(fetcher, periods))
+
+        assert sorted([paper.paper_id for paper in papers] for papers in papers_by_period) == [
+            ["2506.00001", "2506.00002", "2506.00003"],
+            ["2506.00004"],
+        ]
+
+    def test_http_error_ends_period(self, fetcher: ArxivFetcher, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Treat an HTTP error as an empty page."""
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(lambda _: httpx.Response(503))),
+        )
+        periods = [(datetime(2025, 6, 15, tzinfo=UTC), datetime(2025, 6, 15, 23, 59, 59, tzinfo=UTC))]
+
+        assert asyncio.run(collect_periods(fetcher, periods)) == [[]]
+
+
+class TestFetchPapersDayByDay:
+    """Tests for iterating papers window by window."""
+
+    def test_yields_unique_papers_per_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Fetch every window and drop papers already yielded for an earlier window."""
+        papers_by_window = {
+            "20250615000000": ["2506.00001", "2506.00002"],
+            "20250618000000": ["2506.00002", "2506.00003"],
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            search_query = parse.parse_qs(request.url.query.decode())["search_query"][0]
+            return httpx.Response(200, text=build_feed(papers_by_window[search_query.split("[")[1].split(" ")[0]]))
+
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+        monkeypatch.setattr(ArxivFetcher, "min_request_interval", 0.0)
+
+        batches = list(fetch_papers_day_by_day("2025-06-15", "2025-06-20", categories=["cs.CV"]))
+
+        paper_ids = [paper.paper_id for papers in batches for paper in papers]
+        assert sorted(paper_ids) == ["2506.00001", "2506.00002", "2506.00003"]
+
+
+class TestFetchPapersInChunks:
+    """Tests for collecting the papers of a whole range."""
+
+    def test_returns_papers_oldest_first(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Sort papers by publication date whatever the order their windows completed in."""
+        windows = [
+            [Paper.model_construct(paper_id="2506.00003", published_date_ts=3)],
+            [
+                Paper.model_construct(paper_id="2506.00002", published_date_ts=2),
+                Paper.model_construct(paper_id="2506.00001", published_date_ts=1),
+            ],
+        ]
+        monkeypatch.setattr(arxiv_fetcher, "fetch_papers_day_by_day", lambda *_args, **_kwargs: iter(windows))
+
+        papers = arxiv_fetcher.fetch_papers_in_chunks("2025-06-15", "2025-06-20")
+
+        assert [paper.paper_id for paper in papers] == ["2506.00001", "2506.00002", "2506.00003"]
+
+
+class TestSequentialFetching:
+    """Tests for fetching a period over the fetcher's keep-alive client."""
+
+    def test_pages_through_period(self, fetcher: ArxivFetcher) -> None:
+        """Follow pagination until a short page is returned."""
+        pages = {"0": ["2506.00001", "2506.00002"], "2": ["2506.00003"]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = parse.parse_qs(request.url.query.decode())["start"][0]
+            return httpx.Response(200, text=build_feed(pages[start]))
+
+        fetcher._client = httpx.Client(transport=httpx.MockTransport(handler))  # noqa: SLF001
+        with fetcher:
+            papers = fetcher.fetch_papers_for_period(
+                datetime(2025, 6, 15, tzinfo=UTC),
+                datetime(2025, 6, 15, 23, 59, 59, tzinfo=UTC),
+                ["cs.CV"],
+            )
+
+        assert [paper.paper_id for paper in papers] == ["2506.00001", "2506.00002", "2506.00003"]
+
+
+class TestPeriodCache:
+    """Tests for caching the papers of fetched periods on disk."""
+
+    period = (datetime(2025, 6, 15, tzinfo=UTC), datetime(2025, 6, 15, 23, 59, 59, tzinfo=UTC))
+
+    def test_reuses_cached_period(self, fetcher: ArxivFetcher, tmp_path: Path) -> None:
+        """Serve a settled period from the cache instead of querying the API again."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text=build_feed(["2506.00001"]))
+
+        fetcher.cache_dir = tmp_path
+        fetcher._client = httpx.Client(transport=httpx.MockTransport(handler))  # noqa: SLF001
+        with fetcher:
+            fetched = fetcher.fetch_papers_for_period(*self.period, ["cs.CV"])
+            cached = fetcher.fetch_papers_for_period(*self.period, ["cs.CV"])
+
+        assert len(requests) == 1
+        assert cached == fetched
+
+    def test_does_not_cache_failed_period(self, fetcher: ArxivFetcher, tmp_path: Path) -> None:
+        """Leave the cache empty when a page request fails."""
+        fetcher.cache_dir = tmp_path
+        fetcher._client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(503)))  # noqa: SLF001
+        with fetcher:
+            assert fetcher.fetch_papers_for_period(*self.period, ["cs.CV"]) == []
+
+        assert not list(tmp_path.iterdir())
+
+
+class TestIterDailyRangesExcluding:
+    """Tests for iterating days outside the collection window."""
+
+    def test_skips_collection_window(self) -> None:
+        """Yield only days outside the collection window."""
+        days = iter_daily_ranges_excluding(
+            datetime(2025, 6, 1, tzinfo=UTC),
+            datetime(2025, 6, 7, 23, 59, 59, tzinfo=UTC),
+            datetime(2025, 6, 3, tzinfo=UTC),
+            datetime(2025, 6, 5, 23, 59, 59, tzinfo=UTC),
+        )
+
+        assert [start.day for start, _ in days] == [1, 2, 6, 7]
+
+    def test_yields_every_day_without_collection_window(self) -> None:
+        """Yield every day when no collection window is given, the last one ending with the period."""
+        start, end = datetime(2025, 6, 1, tzinfo=UTC), datetime(2025, 6, 3, 12, tzinfo=UTC)
+
+        assert list(iter_daily_ranges_excluding(start, end, None, None)) == [
+            (start, datetime(2025, 6, 1, 23, 59, 59, tzinfo=UTC)),
+            (datetime(2025, 6, 2, tzinfo=UTC), datetime(2025, 6, 2, 23, 59, 59, tzinfo=UTC)),
+            (datetime(2025, 6, 3, tzinfo=UTC), end),
+        ]
+
+
+class TestIterMergedRanges:
+    """Tests for merging daily ranges into multi-day windows."""
+
+    def test_merges_consecutive_days_up_to_limit(self) -> None:
+        """Merge back-to-back days but never across a gap."""
+        days = iter_daily_ranges_excluding(
+            datetime(2025, 6, 1, tzinfo=UTC),
+            datetime(2025, 6, 7, 23, 59, 59, tzinfo=UTC),
+            datetime(2025, 6, 5, tzinfo=UTC),
+            datetime(2025, 6, 5, 23, 59, 59, tzinfo=UTC),
+        )
+
+        windows = list(iter_merged_ranges(days, max_days=3))
+
+        assert [(start.day, end.day) for start, end in windows] == [(1, 3), (4, 4), (6, 7)]
+        assert windows[0][1] == datetime(2025, 6, 3, 23, 59, 59, tzinfo=UTC)
+
+
+class TestExtractArxivId:
+    """Tests for normalizing user supplied arXiv identifiers."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("  2401.01234v2 ", "2401.01234v2"),
+            ("https://arxiv.org/abs/2401.01234", "2401.01234"),
+            ("HTTP://ARXIV.org/pdf/2401.01234v3.pdf", "2401.01234v3"),
+            ("arXiv:2401.01234", "2401.01234"),
+            ("https://arxiv.org/abs/2401.01234/?context=cs", "2401.01234"),
+            ("cs/0501001", "cs/0501001"),
+            ("Attention Is All You Need", None),
+            ("", None),
+        ],
+    )
+    def test_normalizes_identifiers(self, value: str, expected: str | None) -> None:
+        """Strip URL prefixes, suffixes and query strings around the identifier."""
+        assert extract_arxiv_id(value) == expected
@@ -0,0 +1,80 @@
+"""Tests for the embedding service."""
+# ruff: noqa: S101
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.vector_db.embedder import EmbeddingService
+
+
+@pytest.fixture
+def embedding_service() -> EmbeddingService:
+    """Create an EmbeddingService whose Vertex AI client embeds every text as its length."""
+
+    def embed_content(model: str, contents: str | list[str]) -> SimpleNamespace:  # noqa: ARG001
+        texts = [contents] if isinstance(contents, str) else contents
+        return SimpleNamespace(
+            embeddings=[SimpleNamespace(values=[float(len(text))]) for text in texts],
+            metadata=SimpleNamespace(billable_character_count=sum(len(text) for text in texts)),
+        )
+
+    with (
+        patch.object(EmbeddingService, "_load_project_id_from_creds"),
+        patch.object(EmbeddingService, "project", "test-project", create=True),
+        patch("src.service.vector_db.embedder.genai.Client") as client_cls,
+    ):
+        client_cls.return_value = MagicMock()
+        client_cls.return_value.models.embed_content.side_effect = embed_content
+        return EmbeddingService(batch_size=2, max_concurrency=3)
+
+
+class TestEmbedBatch:
+    """Tests for EmbeddingService.embed_batch."""
+
+    def test_keeps_input_order_across_batches(self, embedding_service: EmbeddingService) -> None:
+        """Return one embedding per text, in input order, whatever the batch that embedded it."""
+        texts = ["a" * length for length in range(1, 8)]
+
+        embeddings = embedding_service.embed_batch(texts)
+
+        assert embeddings == [[float(length)] for length in range(1, 8)]
+        assert embedding_service.client.models.embed_content.call_count == 4  # noqa: PLR2004
+
+    def test_accumulates_price_of_every_batch(self, embedding_service: EmbeddingService) -> None:
+        """Add the price of all concurrently embedded batches to the total."""
+        embedding_service.embed_batch(["a" * 1_000_000] * 5)
+
+        assert embedding_service.total_inference_price == pytest.approx(5 * embedding_service.price_per_million_tokens)
+
+    def test_empty_input(self, embedding_service: EmbeddingService) -> None:
+        """Send no request for an empty list of texts."""
+        assert embedding_service.embed_batch([]) == []
+        embedding_service.client.models.embed_content.assert_not_called()
+
+
+class TestEmbedText:
+    """Tests for EmbeddingService.embed_text."""
+
+    def test_repeated_text_is_served_from_cache(self, embedding_service: EmbeddingService) -> None:
+        """Embed a repeated text once and only pay for the first request."""
+        first_embedding = embedding_service.embed_text("diffusion models")
+        price = embedding_service.total_inference_price
+
+        first_embedding.append(0.0)
+        second_embedding = embedding_service.embed_text("diffusion models")
+
+        assert second_embedding == [16.0]
+        assert embedding_service.total_inference_price == price
+        embedding_service.client.models.embed_content.assert_called_once()
+
+    def test_least_recently_used_text_is_evicted(self, embedding_service: EmbeddingService) -> None:
+        """Embed a text again once more recent texts pushed it out of the bounded cache."""
+        embedding_service.text_cache_size = 2
+        for text in ("a", "b", "a", "c", "b"):
+            embedding_service.embed_text(text)
+
+        embed_calls = embedding_service.client.models.embed_content.call_args_list
+        embedded_texts = [call.kwargs["contents"] for call in embed_calls]
+        assert embedded_texts == ["a", "b", "c", "b"]
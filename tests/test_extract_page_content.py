@@ -0,0 +1,35 @@
+"""Tests for the Notion page extractor."""
+# ruff: noqa: S101
+
+from unittest.mock import MagicMock
+
+import orjson
+
+from src.service.notion_db.extract_page_content import NotionPageExtractor
+
+
+class TestGetBlocks:
+    """Tests for NotionPageExtractor.get_blocks."""
+
+    def test_follows_cursors_with_query_params(self) -> None:
+        """Request every page of blocks, passing the cursor as an encoded query parameter."""
+        extractor = NotionPageExtractor()
+        extractor.session = MagicMock()
+        first_page, last_page = MagicMock(), MagicMock()
+        first_page.content = orjson.dumps({"results": [{"id": "a"}], "next_cursor": "cursor/1"})
+        last_page.content = orjson.dumps({"results": [{"id": "b"}], "next_cursor": None})
+        responses = iter([first_page, last_page])
+        sent_params = []
+
+        def get(_url: str, params: dict, **_kwargs: object) -> MagicMock:
+            # The params dict is updated in place between requests, so record a copy
+            sent_params.append(dict(params))
+            return next(responses)
+
+        extractor.session.get.side_effect = get
+
+        blocks = extractor.get_blocks("page-id")
+
+        assert blocks == [{"id": "a"}, {"id": "b"}]
+        assert sent_params == [{"page_size": 100}, {"page_size": 100, "start_cursor": "cursor/1"}]
+        assert extractor.session.get.call_args.args[0].endswith("/blocks/page-id/children")
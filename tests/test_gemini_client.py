@@ -0,0 +1,52 @@
+"""Tests for the Gemini API client."""
+# ruff: noqa: S101
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.service.ai_researcher.gemini_client import GeminiApiClient
+
+
+@pytest.fixture
+def gemini_client() -> GeminiApiClient:
+    """Create a GeminiApiClient with mocked credentials, Vertex AI client and bucket."""
+    with (
+        patch.object(GeminiApiClient, "_load_project_id_from_creds"),
+        patch.object(GeminiApiClient, "project", "test-project", create=True),
+        patch("src.service.ai_researcher.gemini_client.get_genai_client"),
+        patch("src.service.ai_researcher.gemini_client.GoogleBucket"),
+    ):
+        client = GeminiApiClient()
+    client.ask = MagicMock(return_value=MagicMock(text="Answer."))
+    return client
+
+
+class TestPdfAttachment:
+    """Tests for choosing between inline PDFs and bucket uploads."""
+
+    def test_small_pdf_is_sent_inline(self, gemini_client: GeminiApiClient, tmp_path: Path) -> None:
+        """Send a small PDF inline without touching the bucket."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7")
+
+        assert gemini_client("Summarize.", pdf_local_path=str(pdf_path)) == "Answer."
+
+        gemini_client.bucket.upload_file.assert_not_called()
+
+    def test_pdf_too_large_once_encoded_goes_through_bucket(
+        self,
+        gemini_client: GeminiApiClient,
+        tmp_path: Path,
+    ) -> None:
+        """Upload a PDF below the inline limit on disk but above it once base64-encoded, then remove it."""
+        pdf_path = tmp_path / "paper.pdf"
+        with pdf_path.open("wb") as pdf_file:
+            pdf_file.truncate(15 * 1024 * 1024)
+
+        gemini_client("Summarize.", pdf_local_path=str(pdf_path))
+
+        gemini_client.bucket.upload_file.assert_called_once_with(str(pdf_path))
+        gemini_client.bucket.remove_file.assert_called_once_with(gemini_client.bucket.upload_file.return_value)
+        assert gemini_client.inline_pdfs == []
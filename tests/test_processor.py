@@ -0,0 +1,159 @@
+"""Tests for the papers processor."""
+# ruff: noqa: S101, PLR2004
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.service.processor import PapersProcessor
+
+
+@pytest.fixture
+def processor() -> PapersProcessor:
+    """Create a PapersProcessor with mocked vector store and embedding service."""
+    vector_store = MagicMock()
+    vector_store.search.return_value = []
+    vector_store.search_batch.return_value = []
+    return PapersProcessor(vector_store=vector_store, embedding_service=MagicMock())
+
+
+def make_payload(paper_id: str) -> dict:
+    """Build the stored payload of a paper."""
+    return {
+        "paper_id": paper_id,
+        "title": "Title",
+        "authors": ["Author"],
+        "summary": "Summary",
+        "published_date": "2026-03-01T00:00:00Z",
+        "published_date_ts": 1772323200,
+        "updated_date": "2026-03-01T00:00:00Z",
+        "updated_date_ts": 1772323200.0,
+        "pdf_url": f"https://arxiv.org/pdf/{paper_id}.pdf",
+        "primary_category": "cs.CV",
+    }
+
+
+class TestSearchCache:
+    """Tests for caching search_papers results."""
+
+    def test_repeated_query_is_served_from_cache(self, processor: PapersProcessor) -> None:
+        """Search once for queries that only differ by case and whitespace."""
+        processor.search_papers("Diffusion  models", start_date_str="2026-01-01")
+        processor.search_papers(" diffusion models", start_date_str="2026-01-01")
+
+        processor.embedding_service.embed_text.assert_called_once()
+        processor.vector_store.search.assert_called_once()
+
+    def test_filters_are_part_of_the_key(self, processor: PapersProcessor) -> None:
+        """Search again when the same query is run with other filters."""
+        processor.search_papers("diffusion models", k=5)
+        processor.search_papers("diffusion models", k=10)
+
+        assert processor.vector_store.search.call_count == 2
+
+    def test_failed_search_is_not_cached(self, processor: PapersProcessor) -> None:
+        """Search again after the vector store failed, instead of serving the empty result of the failure."""
+        processor.vector_store.search.side_effect = [ConnectionError("Qdrant is unreachable"), []]
+
+        assert processor.search_papers("diffusion models") == []
+        assert processor.search_papers("diffusion models") == []
+
+        assert processor.vector_store.search.call_count == 2
+
+    def test_deleting_papers_clears_cache(self, processor: PapersProcessor) -> None:
+        """Search again once papers were removed from the vector store."""
+        processor.search_papers("diffusion models")
+        processor.delete_papers(["2601.02242"])
+        processor.search_papers("diffusion models")
+
+        assert processor.vector_store.search.call_count == 2
+
+
+class TestDateFilters:
+    """Tests for the published date filters of search_papers."""
+
+    def test_range_is_searched_day_by_day(self, processor: PapersProcessor) -> None:
+        """Search k papers for each day of the range, each from its start to its last second, in one request."""
+        processor.search_papers("diffusion models", k=10, start_date_str="2026-03-01", end_date_str="2026-03-31")
+
+        _, limit, _, day_filters = processor.vector_store.search_batch.call_args.args
+        assert limit == 10
+        assert len(day_filters) == 31
+        start_range, end_range = (condition.range for condition in day_filters[-1].must)
+        assert start_range.gte == datetime(2026, 3, 31).timestamp()  # noqa: DTZ001
+        assert end_range.lt == datetime(2026, 3, 31, 23, 59, 59).timestamp()  # noqa: DTZ001
+        processor.vector_store.search.assert_not_called()
+
+    def test_days_are_merged_by_score(self, processor: PapersProcessor) -> None:
+        """Return the papers of every day, the most similar first."""
+        payloads = [make_payload(f"2603.0000{index}") for index in range(3)]
+        processor.vector_store.search_batch.return_value = [
+            [SimpleNamespace(score=0.7, payload=payloads[0])],
+            [SimpleNamespace(score=0.9, payload=payloads[1]), SimpleNamespace(score=0.8, payload=payloads[2])],
+        ]
+
+        papers = processor.search_papers("diffusion models", start_date_str="2026-03-01", end_date_str="2026-03-02")
+
+        assert [paper.paper_id for paper in papers] == ["2603.00001", "2603.00002", "2603.00000"]
+
+    def test_similar_papers_share_date_filter(self, processor: PapersProcessor) -> None:
+        """Filter similar papers on the same date bounds as searches and exclude the source paper."""
+        processor.vector_store.get_vector.return_value = [0.1, 0.2]
+
+        processor.find_similar_papers("2603.00001", start_date_str="2026-03-01", end_date_str="2026-03-31")
+
+        q_filter = processor.vector_store.search.call_args.kwargs["q_filter"]
+        start_range, end_range = (condition.range for condition in q_filter.must)
+        assert start_range.gte == datetime(2026, 3, 1).timestamp()  # noqa: DTZ001
+        assert end_range.lt == datetime(2026, 3, 31, 23, 59, 59).timestamp()  # noqa: DTZ001
+        assert q_filter.must_not[0].match.value == "2603.00001"
+
+
+class TestPaperCache:
+    """Tests for caching papers and their embeddings by id."""
+
+    def test_paper_is_retrieved_once(self, processor: PapersProcessor) -> None:
+        """Serve a paper looked up again by id from the cache."""
+        processor.vector_store.retrieve.return_value = [SimpleNamespace(payload=make_payload("2603.00001"))]
+
+        first_paper = processor.get_paper_by_id("2603.00001")
+        second_paper = processor.get_paper_by_id("2603.00001")
+
+        assert first_paper is second_paper
+        processor.vector_store.retrieve.assert_called_once()
+
+    def test_search_results_are_cached(self, processor: PapersProcessor) -> None:
+        """Serve papers returned by a search without retrieving them again."""
+        processor.vector_store.search.return_value = [SimpleNamespace(payload=make_payload("2603.00001"))]
+
+        processor.search_papers("diffusion models")
+
+        assert processor.get_paper_by_id("2603.00001").paper_id == "2603.00001"
+        processor.vector_store.retrieve.assert_not_called()
+
+    def test_source_vector_is_fetched_once(self, processor: PapersProcessor) -> None:
+        """Reuse the embedding of a paper whose similar papers are browsed again."""
+        processor.vector_store.get_vector.return_value = [0.1, 0.2]
+
+        processor.find_similar_papers("2603.00001")
+        processor.find_similar_papers("2603.00001", k=10)
+
+        processor.vector_store.get_vector.assert_called_once()
+        assert processor.vector_store.search.call_count == 2
+
+    def test_deleted_papers_are_forgotten(self, processor: PapersProcessor) -> None:
+        """Look a paper and its embedding up again once it was deleted."""
+        processor.vector_store.retrieve.return_value = [SimpleNamespace(payload=make_payload("2603.00001"))]
+        processor.vector_store.get_vector.return_value = [0.1, 0.2]
+        processor.get_paper_by_id("2603.00001")
+        processor.find_similar_papers("2603.00001")
+
+        processor.delete_papers(["2603.00001"])
+        processor.vector_store.retrieve.return_value = []
+        processor.vector_store.get_vector.return_value = []
+
+        assert processor.get_paper_by_id("2603.00001") is None
+        assert processor.find_similar_papers("2603.00001") == []
+        assert processor.vector_store.get_vector.call_count == 2
@@ -0,0 +1,20 @@
+"""Tests for the request rate limiter."""
+# ruff: noqa: S101
+
+import pytest
+
+from src.utils.rate_limiter import RequestRateLimiter
+
+
+class TestRequestRateLimiter:
+    """Tests for spacing out API requests."""
+
+    def test_reserves_consecutive_slots(self) -> None:
+        """Start the first request at once and space the following ones by the interval."""
+        rate_limiter = RequestRateLimiter(min_interval=60.0)
+
+        delays = [rate_limiter.reserve() for _ in range(3)]
+
+        assert delays[0] == 0
+        assert delays[1] == pytest.approx(60.0, abs=1.0)
+        assert delays[2] == pytest.approx(120.0, abs=1.0)
@@ -0,0 +1,55 @@
+"""Tests for the S3 uploader."""
+# ruff: noqa: S101
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.service.notion_db.s3_loader import S3Uploader
+
+
+@pytest.fixture
+def uploader() -> S3Uploader:
+    """Create an S3Uploader with a mocked boto3 session."""
+    with patch("src.service.notion_db.s3_loader.boto3"):
+        return S3Uploader()
+
+
+class TestUploadFile:
+    """Tests for S3Uploader.upload_file."""
+
+    def test_unchanged_file_is_uploaded_once(self, uploader: S3Uploader, tmp_path: Path) -> None:
+        """Return the known public URL when the same file is uploaded to the same key again."""
+        image_path = tmp_path / "figure_1.png"
+        image_path.write_bytes(b"png")
+
+        first_url = uploader.upload_file(str(image_path), "paper/figure_1.png")
+        second_url = uploader.upload_file(str(image_path), "paper/figure_1.png")
+
+        assert first_url == second_url
+        assert first_url.endswith("/reports/paper/figure_1.png")
+        uploader.s3_client.upload_file.assert_called_once()
+
+    def test_modified_file_is_uploaded_again(self, uploader: S3Uploader, tmp_path: Path) -> None:
+        """Upload a file again once it was modified since its last upload."""
+        image_path = tmp_path / "figure_1.png"
+        image_path.write_bytes(b"png")
+        uploader.upload_file(str(image_path), "paper/figure_1.png")
+
+        modified_at = image_path.stat().st_mtime + 10
+        os.utime(image_path, (modified_at, modified_at))
+        uploader.upload_file(str(image_path), "paper/figure_1.png")
+
+        assert uploader.s3_client.upload_file.call_count == 2  # noqa: PLR2004
+
+    def test_content_type_is_set_from_extension(self, uploader: S3Uploader, tmp_path: Path) -> None:
+        """Send the content type guessed from the file extension, whatever its case."""
+        image_path = tmp_path / "figure_1.JPG"
+        image_path.write_bytes(b"jpg")
+
+        uploader.upload_file(str(image_path), "paper/figure_1.JPG")
+
+        extra_args = uploader.s3_client.upload_file.call_args.kwargs["ExtraArgs"]
+        assert extra_args == {"ACL": "public-read", "ContentType": "image/jpeg"}
@@ -0,0 +1,24 @@
+"""Tests for the paper summarizer."""
+# ruff: noqa: S101
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.service.ai_researcher.summarizer import MAX_FILENAME_STEM_BYTES, Summarizer
+from src.utils.schemas import Paper
+
+
+def test_long_non_ascii_title_fits_filename_limit(tmp_path: Path) -> None:
+    """Write the summary of a paper whose title is far longer than a filename can be in UTF-8 bytes."""
+    prompt_path = tmp_path / "prompt.txt"
+    prompt_path.write_text("Summarize.", encoding="utf-8")
+    llm_client = MagicMock(return_value="Summary text.")
+    summarizer = Summarizer(llm_client, str(prompt_path), str(tmp_path / "summaries"))
+    paper = Paper.model_construct(title="Нейронные поля излучения " * 20)
+
+    _, md_path, _, _ = summarizer.summarize(paper, tmp_path / "paper.pdf")
+
+    stem = Path(md_path).name.removesuffix("_summary.md")
+    assert len(stem.encode()) <= MAX_FILENAME_STEM_BYTES
+    assert stem.startswith("нейронные_поля_излучения")
+    assert Path(md_path).read_text(encoding="utf-8") == "Summary text."
@@ -0,0 +1,106 @@
+"""Tests for the Qdrant vector store."""
+# ruff: noqa: S101, PLR2004
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import models as qmodels
+
+from src.service.vector_db.vector_storage import QdrantVectorStore
+from src.utils.schemas import QdrantConnectionConfig
+
+
+@pytest.fixture
+def vector_store() -> QdrantVectorStore:
+    """Create a QdrantVectorStore with a mocked client whose collection already exists."""
+    with patch("src.service.vector_db.vector_storage.QdrantClient"):
+        store = QdrantVectorStore(config=QdrantConnectionConfig(host="localhost", port=6333, api_key=None))
+    store.client.get_collections.return_value = SimpleNamespace(collections=[SimpleNamespace(name=store.collection)])
+    return store
+
+
+def set_date_index(store: QdrantVectorStore, data_type: qmodels.PayloadSchemaType) -> None:
+    """Make the mocked collection report a 'published_date_ts' index of the given type."""
+    store.client.get_collection.return_value = SimpleNamespace(
+        payload_schema={"published_date_ts": qmodels.PayloadIndexInfo(data_type=data_type, points=2)},
+    )
+
+
+class TestEnsureDateIndex:
+    """Tests for the integer 'published_date_ts' index."""
+
+    def test_integer_index_is_kept(self, vector_store: QdrantVectorStore) -> None:
+        """Leave an existing integer index as is."""
+        set_date_index(vector_store, qmodels.PayloadSchemaType.INTEGER)
+
+        vector_store.ensure_collection()
+
+        vector_store.client.create_payload_index.assert_not_called()
+        vector_store.client.scroll.assert_not_called()
+
+    def test_index_is_checked_once(self, vector_store: QdrantVectorStore) -> None:
+        """Read the collection schema on the first call only."""
+        set_date_index(vector_store, qmodels.PayloadSchemaType.INTEGER)
+
+        vector_store.ensure_collection()
+        vector_store.ensure_collection()
+
+        vector_store.client.get_collection.assert_called_once()
+
+    def test_float_payloads_are_migrated_without_index(self, vector_store: QdrantVectorStore) -> None:
+        """Rewrite float timestamps as integers before creating the first integer index."""
+        vector_store.client.get_collection.return_value = SimpleNamespace(payload_schema={})
+        vector_store.client.scroll.return_value = (
+            [SimpleNamespace(id="a", payload={"published_date_ts": 1750000000.0})],
+            None,
+        )
+
+        vector_store.ensure_collection()
+
+        operations = vector_store.client.batch_update_points.call_args.kwargs["update_operations"]
+        assert [operation.set_payload.payload for operation in operations] == [{"published_date_ts": 1750000000}]
+        vector_store.client.delete_payload_index.assert_not_called()
+        vector_store.client.create_payload_index.assert_called_once()
+
+    def test_float_index_is_migrated(self, vector_store: QdrantVectorStore) -> None:
+        """Rewrite float timestamps as integers before replacing the float index with an integer one."""
+        set_date_index(vector_store, qmodels.PayloadSchemaType.FLOAT)
+        vector_store.client.scroll.return_value = (
+            [
+                SimpleNamespace(id="a", payload={"published_date_ts": 1750000000.0}),
+                SimpleNamespace(id="b", payload={"published_date_ts": 1750000001}),
+            ],
+            None,
+        )
+
+        vector_store.ensure_collection()
+
+        operations = vector_store.client.batch_update_points.call_args.kwargs["update_operations"]
+        assert [operation.set_payload.payload for operation in operations] == [{"published_date_ts": 1750000000}]
+        assert [operation.set_payload.points for operation in operations] == [["a"]]
+        vector_store.client.delete_payload_index.assert_called_once()
+        field_schema = vector_store.client.create_payload_index.call_args.kwargs["field_schema"]
+        assert field_schema == qmodels.IntegerIndexParams(
+            type=qmodels.IntegerIndexType.INTEGER,
+            range=True,
+            lookup=False,
+        )
+
+
+class TestSearchBatch:
+    """Tests for QdrantVectorStore.search_batch."""
+
+    def test_long_batches_are_split(self, vector_store: QdrantVectorStore) -> None:
+        """Send at most `max_batch_queries` searches per request and return one result list per filter."""
+        set_date_index(vector_store, qmodels.PayloadSchemaType.INTEGER)
+        vector_store.client.query_batch_points.side_effect = lambda requests, **_kwargs: [
+            SimpleNamespace(points=[]) for _ in requests
+        ]
+
+        results = vector_store.search_batch([0.1, 0.2], 10, 0.65, [None] * 365)
+
+        assert len(results) == 365
+        batch_sizes = [len(call.kwargs["requests"]) for call in vector_store.client.query_batch_points.call_args_list]
+        assert max(batch_sizes) == vector_store.max_batch_queries
+        assert sum(batch_sizes) == 365